@@ -561,19 +561,23 @@ class CliDriver:
                     )
                 if self.lib.get_field_attr(field, "type") == "tag_box":
                     char_count: int = 0
-                    for tag_id in self.lib.get_field_attr(field, "content"):
+                    tag_ids: list[int] = self.lib.get_field_attr(field, "content")
+                    for tag_id in tag_ids:
                         tag = self.lib.get_tag(tag_id)
+                        # NOTE: display_name() looks up the Tag's parent, so
+                        # only build it once per Tag.
+                        tag_name = tag.display_name(self.lib)
                         # Properly wrap Tags on screen
-                        char_count += len(f" {tag.display_name(self.lib)} ") + 1
+                        char_count += len(f" {tag_name} ") + 1
                         if char_count > os.get_terminal_size()[0]:
                             print("")
-                            char_count = len(f" {tag.display_name(self.lib)} ") + 1
+                            char_count = len(f" {tag_name} ") + 1
                         print(
-                            f"{self.get_tag_color(tag.color)} {tag.display_name(self.lib)} {RESET}",
+                            f"{self.get_tag_color(tag.color)} {tag_name} {RESET}",
                             end="",
                         )
                         # If the tag isn't the last one, print a space for the next one.
-                        if tag_id != self.lib.get_field_attr(field, "content")[-1]:
+                        if tag_id != tag_ids[-1]:
                             print(" ", end="")
                         else:
                             print("")
@@ -2074,11 +2078,14 @@ class CliDriver:
                                 self.filtered_entries[index][1]
                             ).fields
                             field_indices: list[int] = []
+                            # The matching templates are the same for every field.
+                            template_ids = set(
+                                self.lib.filter_field_templates(" ".join(com[1:]))
+                            )
                             for i, f in enumerate(entry_fields):
-                                if int(
-                                    self.lib.get_field_attr(f, "id")
-                                ) in self.lib.filter_field_templates(
-                                    " ".join(com[1:]).lower()
+                                if (
+                                    int(self.lib.get_field_attr(f, "id"))
+                                    in template_ids
                                 ):
                                     field_indices.append(i)
 
@@ -2149,11 +2156,14 @@ class CliDriver:
                                 self.filtered_entries[index][1]
                             ).fields
                             field_indices: list[int] = []
+                            # The matching templates are the same for every field.
+                            template_ids = set(
+                                self.lib.filter_field_templates(" ".join(com[1:]))
+                            )
                             for i, f in enumerate(entry_fields):
-                                if int(
-                                    self.lib.get_field_attr(f, "id")
-                                ) in self.lib.filter_field_templates(
-                                    " ".join(com[1:]).lower()
+                                if (
+                                    int(self.lib.get_field_attr(f, "id"))
+                                    in template_ids
                                 ):
                                     field_indices.append(i)
 
@@ -2257,11 +2267,14 @@ class CliDriver:
                                 self.filtered_entries[index][1]
                             ).fields
                             field_indices: list[int] = []
+                            # The matching templates are the same for every field.
+                            template_ids = set(
+                                self.lib.filter_field_templates(" ".join(com[1:]))
+                            )
                             for i, f in enumerate(entry_fields):
-                                if int(
-                                    self.lib.get_field_attr(f, "id")
-                                ) in self.lib.filter_field_templates(
-                                    " ".join(com[1:]).lower()
+                                if (
+                                    int(self.lib.get_field_attr(f, "id"))
+                                    in template_ids
                                 ):
                                     field_indices.append(i)
 
@@ -3374,13 +3387,14 @@ class CliDriver:
             char_count: int = 0
             for id in tag.subtag_ids:
                 st = self.lib.get_tag(id)
+                st_name = st.display_name(self.lib)
                 # Properly wrap Tags on screen
-                char_count += len(f" {st.display_name(self.lib)} ") + 1
+                char_count += len(f" {st_name} ") + 1
                 if char_count > os.get_terminal_size()[0]:
                     print("")
-                    char_count = len(f" {st.display_name(self.lib)} ") + 1
+                    char_count = len(f" {st_name} ") + 1
                 print(
-                    f"{self.get_tag_color(st.color)} {st.display_name(self.lib)} {RESET}",
+                    f"{self.get_tag_color(st.color)} {st_name} {RESET}",
                     end="",
                 )
                 # If the tag isn't the last one, print a space for the next one.
@@ -3577,13 +3591,14 @@ class CliDriver:
         char_count: int = 0
         for id in tag.subtag_ids:
             st = self.lib.get_tag(id)
+            st_name = st.display_name(self.lib)
             # Properly wrap Tags on screen
-            char_count += len(f" {st.display_name(self.lib)} ") + 1
+            char_count += len(f" {st_name} ") + 1
             if char_count > os.get_terminal_size()[0]:
                 print("")
-                char_count = len(f" {st.display_name(self.lib)} ") + 1
+                char_count = len(f" {st_name} ") + 1
             print(
-                f"{self.get_tag_color(st.color)} {st.display_name(self.lib)} {RESET}",
+                f"{self.get_tag_color(st.color)} {st_name} {RESET}",
                 end="",
             )
             # If the tag isn't the last one, print a space for the next one.
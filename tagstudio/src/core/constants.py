@@ -8,7 +8,8 @@ COLLAGE_FOLDER_NAME: str = "collages"
 LIBRARY_FILENAME: str = "ts_library.json"
 
 # TODO: Turn this whitelist into a user-configurable blacklist.
-IMAGE_TYPES: list[str] = [
+# NOTE: These are tuples so they're built once and can't be mutated by callers.
+IMAGE_TYPES: tuple[str, ...] = (
     ".png",
     ".jpg",
     ".jpeg",
@@ -28,8 +29,8 @@ IMAGE_TYPES: list[str] = [
     ".jp2",
     ".j2k",
     ".jpg2",
-]
-RAW_IMAGE_TYPES: list[str] = [
+)
+RAW_IMAGE_TYPES: tuple[str, ...] = (
     ".raw",
     ".dng",
     ".rw2",
@@ -38,8 +39,8 @@ RAW_IMAGE_TYPES: list[str] = [
     ".crw",
     ".cr2",
     ".cr3",
-]
-VIDEO_TYPES: list[str] = [
+)
+VIDEO_TYPES: tuple[str, ...] = (
     ".mp4",
     ".webm",
     ".mov",
@@ -52,8 +53,8 @@ VIDEO_TYPES: list[str] = [
     ".m4p",
     ".m4v",
     ".3gp",
-]
-AUDIO_TYPES: list[str] = [
+)
+AUDIO_TYPES: tuple[str, ...] = (
     ".mp3",
     ".mp4",
     ".mpeg4",
@@ -65,8 +66,8 @@ AUDIO_TYPES: list[str] = [
     ".wma",
     ".ogg",
     ".aiff",
-]
-DOC_TYPES: list[str] = [
+)
+DOC_TYPES: tuple[str, ...] = (
     ".txt",
     ".rtf",
     ".md",
@@ -76,8 +77,8 @@ DOC_TYPES: list[str] = [
     ".tex",
     ".odt",
     ".pages",
-]
-PLAINTEXT_TYPES: list[str] = [
+)
+PLAINTEXT_TYPES: tuple[str, ...] = (
     ".txt",
     ".md",
     ".css",
@@ -92,10 +93,10 @@ PLAINTEXT_TYPES: list[str] = [
     ".php",
     ".sh",
     ".bat",
-]
-SPREADSHEET_TYPES: list[str] = [".csv", ".xls", ".xlsx", ".numbers", ".ods"]
-PRESENTATION_TYPES: list[str] = [".ppt", ".pptx", ".key", ".odp"]
-ARCHIVE_TYPES: list[str] = [
+)
+SPREADSHEET_TYPES: tuple[str, ...] = (".csv", ".xls", ".xlsx", ".numbers", ".ods")
+PRESENTATION_TYPES: tuple[str, ...] = (".ppt", ".pptx", ".key", ".odp")
+ARCHIVE_TYPES: tuple[str, ...] = (
     ".zip",
     ".rar",
     ".tar",
@@ -104,11 +105,11 @@ ARCHIVE_TYPES: list[str] = [
     ".tgz",
     ".7z",
     ".s7z",
-]
-PROGRAM_TYPES: list[str] = [".exe", ".app"]
-SHORTCUT_TYPES: list[str] = [".lnk", ".desktop", ".url"]
+)
+PROGRAM_TYPES: tuple[str, ...] = (".exe", ".app")
+SHORTCUT_TYPES: tuple[str, ...] = (".lnk", ".desktop", ".url")
 
-ALL_FILE_TYPES: list[str] = (
+ALL_FILE_TYPES: tuple[str, ...] = (
     IMAGE_TYPES
     + VIDEO_TYPES
     + AUDIO_TYPES
@@ -120,9 +121,10 @@ ALL_FILE_TYPES: list[str] = (
     + SHORTCUT_TYPES
 )
 
-BOX_FIELDS = ["tag_box", "text_box"]
-TEXT_FIELDS = ["text_line", "text_box"]
-DATE_FIELDS = ["datetime"]
+BOX_FIELDS = ("tag_box", "text_box")
+TEXT_FIELDS = ("text_line", "text_box")
+TAG_FIELDS = ("tag_box",)
+DATE_FIELDS = ("datetime",)
 
 TAG_COLORS = [
     "",
@@ -19,6 +19,14 @@ class Theme(str, enum.Enum):
     COLOR_DISABLED_BG = "#65440D12"
 
 
+class ItemType(enum.Enum):
+    """Types of items that can be returned from a Library search."""
+
+    ENTRY = 0
+    COLLATION = 1
+    TAG_GROUP = 2
+
+
 class SearchMode(int, enum.Enum):
     """Operational modes for item searching."""
 
@@ -26,7 +34,13 @@ class SearchMode(int, enum.Enum):
     OR = 1
 
 
-class FieldID(int, enum.Enum):
+class FieldID:
+    """
+    IDs of the built-in field templates.
+    These are plain ints rather than an Enum since they're used directly as
+    Entry field keys and compared/hashed on every field access.
+    """
+
     TITLE = 0
     AUTHOR = 1
     ARTIST = 2
@@ -6,6 +6,8 @@
 class FieldTemplate:
     """A TagStudio Library Field Template object."""
 
+    __slots__ = ("id", "name", "type")
+
     def __init__(self, id: int, name: str, type: str) -> None:
         self.id = id
         self.name = name
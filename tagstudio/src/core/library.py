@@ -5,6 +5,7 @@
 """The Library object and related methods for TagStudio."""
 
 import datetime
+import functools
 import logging
 import os
 import time
@@ -12,19 +13,21 @@ import traceback
 import xml.etree.ElementTree as ET
 import ujson
 
-from enum import Enum
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import cast, Generator
+from typing import cast, Callable, Generator
 from typing_extensions import Self
 
-from src.core.enums import FieldID
+from src.core.enums import FieldID, ItemType, SearchMode
 from src.core.json_typing import JsonCollation, JsonEntry, JsonLibary, JsonTag
 from src.core.utils.str import strip_punctuation
 from src.core.utils.web import strip_web_protocol
-from src.core.enums import SearchMode
 from src.core.constants import (
     BACKUP_FOLDER_NAME,
     COLLAGE_FOLDER_NAME,
+    DATE_FIELDS,
+    TAG_FIELDS,
     TEXT_FIELDS,
     TS_FOLDER_NAME,
     VERSION,
@@ -32,12 +35,65 @@ from src.core.constants import (
 
 TYPE = ["file", "meta", "alt", "mask"]
 
+# The built-in Field templates. These never change at runtime, so they're built
+# once at import and shared between Library instances rather than per instance.
+DEFAULT_FIELDS: tuple[dict, ...] = (
+    {"id": 0, "name": "Title", "type": "text_line"},
+    {"id": 1, "name": "Author", "type": "text_line"},
+    {"id": 2, "name": "Artist", "type": "text_line"},
+    {"id": 3, "name": "URL", "type": "text_line"},
+    {"id": 4, "name": "Description", "type": "text_box"},
+    {"id": 5, "name": "Notes", "type": "text_box"},
+    {"id": 6, "name": "Tags", "type": "tag_box"},
+    {"id": 7, "name": "Content Tags", "type": "tag_box"},
+    {"id": 8, "name": "Meta Tags", "type": "tag_box"},
+    {"id": 9, "name": "Collation", "type": "collation"},
+    {"id": 10, "name": "Date", "type": "datetime"},
+    {"id": 11, "name": "Date Created", "type": "datetime"},
+    {"id": 12, "name": "Date Modified", "type": "datetime"},
+    {"id": 13, "name": "Date Taken", "type": "datetime"},
+    {"id": 14, "name": "Date Published", "type": "datetime"},
+    {"id": 15, "name": "Archived", "type": "checkbox"},
+    {"id": 16, "name": "Favorite", "type": "checkbox"},
+    {"id": 17, "name": "Book", "type": "collation"},
+    {"id": 18, "name": "Comic", "type": "collation"},
+    {"id": 19, "name": "Series", "type": "collation"},
+    {"id": 20, "name": "Manga", "type": "collation"},
+    {"id": 21, "name": "Source", "type": "text_line"},
+    {"id": 22, "name": "Date Uploaded", "type": "datetime"},
+    {"id": 23, "name": "Date Released", "type": "datetime"},
+    {"id": 24, "name": "Volume", "type": "collation"},
+    {"id": 25, "name": "Anthology", "type": "collation"},
+    {"id": 26, "name": "Magazine", "type": "collation"},
+    {"id": 27, "name": "Publisher", "type": "text_line"},
+    {"id": 28, "name": "Guest Artist", "type": "text_line"},
+    {"id": 29, "name": "Composer", "type": "text_line"},
+    {"id": 30, "name": "Comments", "type": "text_box"},
+)
+# Map of every built-in Field template ID to its template.
+DEFAULT_FIELDS_BY_ID: dict[int, dict] = {f["id"]: f for f in DEFAULT_FIELDS}
+
+# Builds the empty content for a newly added Field, by Field type.
+_FIELD_CONTENT_FACTORIES: dict[str, Callable[[], str | list]] = {
+    **dict.fromkeys(TEXT_FIELDS, str),
+    **dict.fromkeys(DATE_FIELDS, str),
+    **dict.fromkeys(TAG_FIELDS, list),
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _to_path(path: str) -> Path:
+    """
+    Returns a Path for an Entry's path string.
+    Many Entries share the same folder, so the (immutable) Path objects are cached
+    instead of parsing the same string again for every Entry.
+    """
+    return Path(path)
 
-# RESULT_TYPE = Enum('Result', ['ENTRY', 'COLLATION', 'TAG_GROUP'])
-class ItemType(Enum):
-    ENTRY = 0
-    COLLATION = 1
-    TAG_GROUP = 2
+
+def _are_files(paths: list[str]) -> list[bool]:
+    """Returns whether each of the given paths points to an existing file."""
+    return [os.path.isfile(p) for p in paths]
 
 
 logging.basicConfig(format="%(message)s", level=logging.INFO)
@@ -46,13 +102,17 @@ logging.basicConfig(format="%(message)s", level=logging.INFO)
 class Entry:
     """A Library Entry Object. Referenced by ID."""
 
+    # There's one of these per file in the Library, so skip the per-instance __dict__.
+    __slots__ = ("id", "filename", "path", "fields", "type")
+
     def __init__(
         self, id: int, filename: str | Path, path: str | Path, fields: list[dict]
     ) -> None:
         # Required Fields ======================================================
         self.id = int(id)
-        self.filename = Path(filename)
-        self.path = Path(path)
+        # Paths are immutable, so reuse ones that are already Path objects.
+        self.filename = filename if isinstance(filename, Path) else Path(filename)
+        self.path = path if isinstance(path, Path) else _to_path(path)
         self.fields: list[dict] = fields
         self.type = None
 
@@ -86,9 +146,11 @@ class Entry:
         return self.__str__()
 
     def __eq__(self, __value: object) -> bool:
+        if type(__value) is not type(self):
+            return NotImplemented
         __value = cast(Self, __value)
         return (
-            int(self.id) == int(__value.id)
+            self.id == __value.id
             and self.filename == __value.filename
             and self.path == __value.path
             and self.fields == __value.fields
@@ -101,9 +163,9 @@ class Entry:
         """
         obj: JsonEntry = {"id": self.id}
         if self.filename:
-            obj["filename"] = str(self.filename)
+            obj["filename"] = os.fspath(self.filename)
         if self.path:
-            obj["path"] = str(self.path)
+            obj["path"] = os.fspath(self.path)
         if self.fields:
             obj["fields"] = self.fields
 
@@ -112,30 +174,50 @@ class Entry:
     def has_tag(self, library: "Library", tag_id: int) -> bool:
         if self.fields:
             for f in self.fields:
-                if library.get_field_attr(f, "type") == "tag_box":
-                    if tag_id in library.get_field_attr(f, "content"):
+                field_id = next(iter(f))
+                if library.get_field_obj(field_id)["type"] == "tag_box":
+                    if tag_id in f[field_id]:
                         return True
         return False
 
+    def tag_ids(self, library: "Library") -> set[int]:
+        """
+        Returns the IDs of every Tag in the Entry's tag_box fields.
+        Useful for checking several Tags at once with a single pass over the fields.
+        """
+        tag_ids: set[int] = set()
+        if self.fields:
+            for f in self.fields:
+                field_id = next(iter(f))
+                if library.get_field_obj(field_id)["type"] == "tag_box":
+                    tag_ids.update(f[field_id])
+        return tag_ids
+
     def remove_tag(self, library: "Library", tag_id: int, field_index=-1):
         """
         Removes a Tag from the Entry. If given a field index, the given Tag will
         only be removed from that index. If left blank, all instances of that
         Tag will be removed from the Entry.
         """
-        if self.fields:
-            for i, f in enumerate(self.fields):
-                if library.get_field_attr(f, "type") == "tag_box":
-                    if field_index >= 0 and field_index == i:
-                        t: list[int] = library.get_field_attr(f, "content")
-                        logging.info(
-                            f't:{tag_id}, i:{i}, idx:{field_index}, c:{library.get_field_attr(f, "content")}'
-                        )
-                        t.remove(tag_id)
-                    elif field_index < 0:
-                        t = library.get_field_attr(f, "content")
-                        while tag_id in t:
-                            t.remove(tag_id)
+        if not self.fields:
+            return
+        # Given a field index, only that field needs checking.
+        if field_index >= 0:
+            fields = self.fields[field_index : field_index + 1]
+        else:
+            fields = self.fields
+        for f in fields:
+            field_id = next(iter(f))
+            if library.get_field_obj(field_id)["type"] == "tag_box":
+                t: list[int] = f[field_id]
+                if field_index >= 0:
+                    logging.info(
+                        f"t:{tag_id}, i:{field_index}, idx:{field_index}, c:{t}"
+                    )
+                    t.remove(tag_id)
+                elif tag_id in t:
+                    # Drop every instance in one pass rather than one remove() each.
+                    t[:] = [x for x in t if x != tag_id]
 
     def add_tag(
         self, library: "Library", tag_id: int, field_id: int, field_index: int = -1
@@ -144,7 +226,7 @@ class Entry:
         # if field_index != -1:
         # logging.info(f'[LIBRARY] ADD TAG to E:{self.id}, F-DI:{field_id}, F-INDEX:{field_index}')
         for i, f in enumerate(self.fields):
-            if library.get_field_attr(f, "id") == field_id:
+            if next(iter(f)) == field_id:
                 field_index = i
                 # logging.info(f'[LIBRARY] FOUND F-INDEX:{field_index}')
                 break
@@ -154,16 +236,20 @@ class Entry:
             # logging.info(f'[LIBRARY] USING NEWEST F-INDEX:{field_index}')
 
         # logging.info(list(self.fields[field_index].keys()))
-        field_id = list(self.fields[field_index].keys())[0]
+        field = self.fields[field_index]
+        field_id = next(iter(field))
         # logging.info(f'Entry Field ID: {field_id}, Index: {field_index}')
 
-        tags: list[int] = self.fields[field_index][field_id]
+        tags: list[int] = field[field_id]
         if tag_id not in tags:
             # logging.info(f'Adding Tag: {tag_id}')
             tags.append(tag_id)
-            self.fields[field_index][field_id] = sorted(
-                tags, key=lambda t: library.get_tag(t).display_name(library)
-            )
+            # NOTE: A lone Tag (ex. in a newly added field) is already in order,
+            # so its display name doesn't need building just to sort it.
+            if len(tags) > 1:
+                field[field_id] = sorted(
+                    tags, key=lambda t: library.get_tag(t).display_name(library)
+                )
 
         # logging.info(f'Tags: {self.fields[field_index][field_id]}')
 
@@ -171,6 +257,8 @@ class Entry:
 class Tag:
     """A Library Tag Object. Referenced by ID."""
 
+    __slots__ = ("id", "name", "shorthand", "aliases", "subtag_ids", "color")
+
     def __init__(
         self,
         id: int,
@@ -185,11 +273,7 @@ class Tag:
         self.shorthand = shorthand
         self.aliases = aliases
         # Ensures no duplicates while retaining order.
-        self.subtag_ids: list[int] = []
-        for s in subtags_ids:
-            if int(s) not in self.subtag_ids:
-                self.subtag_ids.append(int(s))
-        # [int(s) for s in subtags_ids]
+        self.subtag_ids: list[int] = list(dict.fromkeys(int(s) for s in subtags_ids))
         self.color = color
 
     def __str__(self) -> str:
@@ -210,12 +294,11 @@ class Tag:
     def display_name(self, library: "Library") -> str:
         """Returns a formatted tag name intended for displaying."""
         if self.subtag_ids:
-            if library.get_tag(self.subtag_ids[0]).shorthand:
-                return (
-                    f"{self.name}" f" ({library.get_tag(self.subtag_ids[0]).shorthand})"
-                )
+            parent_tag = library.get_tag(self.subtag_ids[0])
+            if parent_tag.shorthand:
+                return f"{self.name} ({parent_tag.shorthand})"
             else:
-                return f"{self.name}" f" ({library.get_tag(self.subtag_ids[0]).name})"
+                return f"{self.name} ({parent_tag.name})"
         else:
             return f"{self.name}"
 
@@ -256,6 +339,8 @@ class Collation:
     Sort order is `(filename | title | date, asc | desc)`.
     """
 
+    __slots__ = ("id", "title", "e_ids_and_pages", "sort_order", "cover_id", "fields")
+
     def __init__(
         self,
         id: int,
@@ -278,8 +363,10 @@ class Collation:
         return self.__str__()
 
     def __eq__(self, __value: object) -> bool:
+        if type(__value) is not type(self):
+            return NotImplemented
         __value = cast(Self, __value)
-        return int(self.id) == int(__value.id) and self.fields == __value.fields
+        return self.id == __value.id and self.fields == __value.fields
 
     def compressed_dict(self) -> JsonCollation:
         """
@@ -345,6 +432,9 @@ class Library:
         self.default_ext_exclude_list: list[str] = [".json", ".xmp", ".aae"]
         self.ext_list: list[str] = []
         self.is_exclude_list: bool = True
+        # The lowercased extension set, along with the list contents it was built from.
+        self._ext_set_key: tuple[str, ...] = ()
+        self._ext_set_cache: set[str] = set()
 
         # Tags =================================================================
         # List of every Tag object (ts-v8).
@@ -383,39 +473,7 @@ class Library:
         # 	Tag(id=1, name='Favorite', shorthand='', aliases=['Favorited, Favorites, Likes, Liked, Loved'], subtags_ids=[], color='yellow'),
         # ]
 
-        self.default_fields: list[dict] = [
-            {"id": 0, "name": "Title", "type": "text_line"},
-            {"id": 1, "name": "Author", "type": "text_line"},
-            {"id": 2, "name": "Artist", "type": "text_line"},
-            {"id": 3, "name": "URL", "type": "text_line"},
-            {"id": 4, "name": "Description", "type": "text_box"},
-            {"id": 5, "name": "Notes", "type": "text_box"},
-            {"id": 6, "name": "Tags", "type": "tag_box"},
-            {"id": 7, "name": "Content Tags", "type": "tag_box"},
-            {"id": 8, "name": "Meta Tags", "type": "tag_box"},
-            {"id": 9, "name": "Collation", "type": "collation"},
-            {"id": 10, "name": "Date", "type": "datetime"},
-            {"id": 11, "name": "Date Created", "type": "datetime"},
-            {"id": 12, "name": "Date Modified", "type": "datetime"},
-            {"id": 13, "name": "Date Taken", "type": "datetime"},
-            {"id": 14, "name": "Date Published", "type": "datetime"},
-            {"id": 15, "name": "Archived", "type": "checkbox"},
-            {"id": 16, "name": "Favorite", "type": "checkbox"},
-            {"id": 17, "name": "Book", "type": "collation"},
-            {"id": 18, "name": "Comic", "type": "collation"},
-            {"id": 19, "name": "Series", "type": "collation"},
-            {"id": 20, "name": "Manga", "type": "collation"},
-            {"id": 21, "name": "Source", "type": "text_line"},
-            {"id": 22, "name": "Date Uploaded", "type": "datetime"},
-            {"id": 23, "name": "Date Released", "type": "datetime"},
-            {"id": 24, "name": "Volume", "type": "collation"},
-            {"id": 25, "name": "Anthology", "type": "collation"},
-            {"id": 26, "name": "Magazine", "type": "collation"},
-            {"id": 27, "name": "Publisher", "type": "text_line"},
-            {"id": 28, "name": "Guest Artist", "type": "text_line"},
-            {"id": 29, "name": "Composer", "type": "text_line"},
-            {"id": 30, "name": "Comments", "type": "text_box"},
-        ]
+        self.default_fields: tuple[dict, ...] = DEFAULT_FIELDS
 
     def create_library(self, path: Path) -> int:
         """
@@ -430,7 +488,7 @@ class Library:
         try:
             self.clear_internal_vars()
             self.library_dir = Path(path)
-            self.verify_ts_folders()
+            # NOTE: Saving creates the TagStudio folders itself.
             self.save_library_to_disk()
             self.open_library(self.library_dir)
         except:
@@ -469,9 +527,10 @@ class Library:
         save file. Takes in and returns the tag dictionary from the JSON file.
         """
         missing: list[JsonTag] = []
+        tag_ids = {t["id"] for t in tag_list}
 
         for dt in self.default_tags:
-            if dt["id"] not in [t["id"] for t in tag_list]:
+            if dt["id"] not in tag_ids:
                 missing.append(dt)
 
         for m in missing:
@@ -491,165 +550,142 @@ class Library:
 
         if (_path / TS_FOLDER_NAME / "ts_library.json").exists():
             try:
-                with open(
-                    _path / TS_FOLDER_NAME / "ts_library.json",
-                    "r",
-                    encoding="utf-8",
-                ) as file:
-                    json_dump: JsonLibary = ujson.load(file)
-                    self.library_dir = Path(_path)
-                    self.verify_ts_folders()
-                    major, minor, patch = json_dump["ts-version"].split(".")
-
-                    # Load Extension List --------------------------------------
+                # NOTE: The raw bytes are handed straight to ujson, which decodes
+                # the UTF-8 itself instead of going through a text-mode wrapper.
+                # The file is closed before parsing, so it isn't held open (and
+                # locked on Windows) while the rest of the Library is loaded.
+                json_bytes = (_path / TS_FOLDER_NAME / "ts_library.json").read_bytes()
+                json_dump: JsonLibary = ujson.loads(json_bytes)
+                self.library_dir = Path(_path)
+                self.verify_ts_folders()
+                major, minor, patch = json_dump["ts-version"].split(".")
+
+                # Load Extension List --------------------------------------
+                start_time = time.time()
+                if "ignored_extensions" in json_dump:
+                    self.ext_list = json_dump.get(
+                        "ignored_extensions", self.default_ext_exclude_list
+                    )
+                else:
+                    self.ext_list = json_dump.get(
+                        "ext_list", self.default_ext_exclude_list
+                    )
+
+                # Sanitizes older lists (v9.2.1) that don't use leading periods.
+                # Without this, existing lists (including default lists)
+                # have to otherwise be updated by hand in order to restore
+                # previous functionality.
+                sanitized_list: list[str] = []
+                for ext in self.ext_list:
+                    if not ext.startswith("."):
+                        ext = "." + ext
+                    sanitized_list.append(ext)
+                self.ext_list = sanitized_list
+
+                self.is_exclude_list = json_dump.get("is_exclude_list", True)
+                end_time = time.time()
+                logging.info(
+                    f"[LIBRARY] Extension list loaded in {(end_time - start_time):.3f} seconds"
+                )
+
+                # Parse Tags -----------------------------------------------
+                if "tags" in json_dump.keys():
                     start_time = time.time()
-                    if "ignored_extensions" in json_dump:
-                        self.ext_list = json_dump.get(
-                            "ignored_extensions", self.default_ext_exclude_list
-                        )
-                    else:
-                        self.ext_list = json_dump.get(
-                            "ext_list", self.default_ext_exclude_list
-                        )
 
-                    # Sanitizes older lists (v9.2.1) that don't use leading periods.
-                    # Without this, existing lists (including default lists)
-                    # have to otherwise be updated by hand in order to restore
-                    # previous functionality.
-                    sanitized_list: list[str] = []
-                    for ext in self.ext_list:
-                        if not ext.startswith("."):
-                            ext = "." + ext
-                        sanitized_list.append(ext)
-                    self.ext_list = sanitized_list
-
-                    self.is_exclude_list = json_dump.get("is_exclude_list", True)
-                    end_time = time.time()
-                    logging.info(
-                        f"[LIBRARY] Extension list loaded in {(end_time - start_time):.3f} seconds"
-                    )
+                    # Step 1: Verify default built-in tags are present.
+                    json_dump["tags"] = self.verify_default_tags(json_dump["tags"])
 
-                    # Parse Tags -----------------------------------------------
-                    if "tags" in json_dump.keys():
-                        start_time = time.time()
-
-                        # Step 1: Verify default built-in tags are present.
-                        json_dump["tags"] = self.verify_default_tags(json_dump["tags"])
-
-                        for tag in json_dump["tags"]:
-                            # Step 2: Create a Tag object and append it to the internal Tags list,
-                            # then map that Tag's ID to its index in the Tags list.
-
-                            id = int(tag.get("id", 0))
-
-                            # Don't load tags with duplicate IDs
-                            if id not in {t.id for t in self.tags}:
-                                if id >= self._next_tag_id:
-                                    self._next_tag_id = id + 1
-
-                                name = tag.get("name", "")
-                                shorthand = tag.get("shorthand", "")
-                                aliases = tag.get("aliases", [])
-                                subtag_ids = tag.get("subtag_ids", [])
-                                color = tag.get("color", "")
-
-                                t = Tag(
-                                    id=id,
-                                    name=name,
-                                    shorthand=shorthand,
-                                    aliases=aliases,
-                                    subtags_ids=subtag_ids,
-                                    color=color,
-                                )
-
-                                # NOTE: This does NOT use the add_tag_to_library() method!
-                                # That method is only used for Tags added at runtime.
-                                # This process uses the same inner methods, but waits until all of the
-                                # Tags are registered in the Tags list before creating the Tag clusters.
-                                self.tags.append(t)
-                                self._map_tag_id_to_index(t, -1)
-                                self._map_tag_strings_to_tag_id(t)
-                            else:
-                                logging.info(
-                                    f"[LIBRARY]Skipping Tag with duplicate ID: {tag}"
-                                )
+                    for tag in json_dump["tags"]:
+                        # Step 2: Create a Tag object and append it to the internal Tags list,
+                        # then map that Tag's ID to its index in the Tags list.
 
-                        # Step 3: Map each Tag's subtags together now that all Tag objects in it.
-                        for t in self.tags:
-                            self._map_tag_id_to_cluster(t)
+                        id = int(tag.get("id", 0))
 
-                        end_time = time.time()
-                        logging.info(
-                            f"[LIBRARY] Tags loaded in {(end_time - start_time):.3f} seconds"
-                        )
+                        # Don't load tags with duplicate IDs
+                        if id not in self._tag_id_to_index_map:
+                            if id >= self._next_tag_id:
+                                self._next_tag_id = id + 1
 
-                    # Parse Entries --------------------------------------------
-                    if entries := json_dump.get("entries"):
-                        start_time = time.time()
-                        for entry in entries:
-                            if "id" in entry:
-                                id = int(entry["id"])
-                                if id >= self._next_entry_id:
-                                    self._next_entry_id = id + 1
-                            else:
-                                # Version 9.1.x+ Compatibility
-                                id = self._next_entry_id
-                                self._next_entry_id += 1
-
-                            filename = entry.get("filename", "")
-                            e_path = entry.get("path", "")
-                            fields: list = []
-                            if "fields" in entry:
-                                # Cast JSON str keys to ints
-
-                                for f in entry["fields"]:
-                                    f[int(list(f.keys())[0])] = f[list(f.keys())[0]]
-                                    del f[list(f.keys())[0]]
-                                fields = entry["fields"]
-
-                            # Look through fields for legacy Collation data ----
-                            if int(major) >= 9 and int(minor) < 1:
-                                for f in fields:
-                                    if self.get_field_attr(f, "type") == "collation":
-                                        # NOTE: This legacy support will be removed in
-                                        # a later version, probably 9.2.
-                                        # Legacy Collation data present in v9.0.x
-                                        # DATA SHAPE: {name: str, page: int}
-
-                                        # We'll do an inefficient linear search each
-                                        # time to convert the legacy data.
-                                        matched = False
-                                        collation_id = -1
-                                        for c in self.collations:
-                                            if (
-                                                c.title
-                                                == self.get_field_attr(f, "content")[
-                                                    "name"
-                                                ]
-                                            ):
-                                                c.e_ids_and_pages.append(
-                                                    (
-                                                        id,
-                                                        int(
-                                                            self.get_field_attr(
-                                                                f, "content"
-                                                            )["page"]
-                                                        ),
-                                                    )
-                                                )
-                                                matched = True
-                                                collation_id = c.id
-                                        if not matched:
-                                            c = Collation(
-                                                id=self._next_collation_id,
-                                                title=self.get_field_attr(f, "content")[
-                                                    "name"
-                                                ],
-                                                e_ids_and_pages=[],
-                                                sort_order="",
-                                            )
-                                            collation_id = self._next_collation_id
-                                            self._next_collation_id += 1
+                            name = tag.get("name", "")
+                            shorthand = tag.get("shorthand", "")
+                            aliases = tag.get("aliases", [])
+                            subtag_ids = tag.get("subtag_ids", [])
+                            color = tag.get("color", "")
+
+                            t = Tag(
+                                id=id,
+                                name=name,
+                                shorthand=shorthand,
+                                aliases=aliases,
+                                subtags_ids=subtag_ids,
+                                color=color,
+                            )
+
+                            # NOTE: This does NOT use the add_tag_to_library() method!
+                            # That method is only used for Tags added at runtime.
+                            # This process uses the same inner methods, but waits until all of the
+                            # Tags are registered in the Tags list before creating the Tag clusters.
+                            self.tags.append(t)
+                            self._map_tag_id_to_index(t, -1)
+                            self._map_tag_strings_to_tag_id(t)
+                        else:
+                            logging.info(
+                                f"[LIBRARY]Skipping Tag with duplicate ID: {tag}"
+                            )
+
+                    # Step 3: Map each Tag's subtags together now that all Tag objects in it.
+                    for t in self.tags:
+                        self._map_tag_id_to_cluster(t)
+
+                    end_time = time.time()
+                    logging.info(
+                        f"[LIBRARY] Tags loaded in {(end_time - start_time):.3f} seconds"
+                    )
+
+                # Parse Entries --------------------------------------------
+                if entries := json_dump.get("entries"):
+                    start_time = time.time()
+                    # The version check is the same for every Entry, so do it once.
+                    has_legacy_collations = int(major) >= 9 and int(minor) < 1
+                    for entry in entries:
+                        if "id" in entry:
+                            id = int(entry["id"])
+                            if id >= self._next_entry_id:
+                                self._next_entry_id = id + 1
+                        else:
+                            # Version 9.1.x+ Compatibility
+                            id = self._next_entry_id
+                            self._next_entry_id += 1
+
+                        filename = entry.get("filename", "")
+                        e_path = entry.get("path", "")
+                        fields: list = []
+                        if "fields" in entry:
+                            # Cast JSON str keys to ints
+                            fields = [
+                                {int(k): v for k, v in f.items()}
+                                for f in entry["fields"]
+                            ]
+
+                        # Look through fields for legacy Collation data ----
+                        # (Collation Field data present in v9.1.x+ is already an int.)
+                        if has_legacy_collations:
+                            for f in fields:
+                                if self.get_field_attr(f, "type") == "collation":
+                                    # NOTE: This legacy support will be removed in
+                                    # a later version, probably 9.2.
+                                    # Legacy Collation data present in v9.0.x
+                                    # DATA SHAPE: {name: str, page: int}
+
+                                    # We'll do an inefficient linear search each
+                                    # time to convert the legacy data.
+                                    matched = False
+                                    collation_id = -1
+                                    for c in self.collations:
+                                        if (
+                                            c.title
+                                            == self.get_field_attr(f, "content")["name"]
+                                        ):
                                             c.e_ids_and_pages.append(
                                                 (
                                                     id,
@@ -660,73 +696,91 @@ class Library:
                                                     ),
                                                 )
                                             )
-                                            self.collations.append(c)
-                                            self._map_collation_id_to_index(c, -1)
-                                        f_id = self.get_field_attr(f, "id")
-                                        f.clear()
-                                        f[int(f_id)] = collation_id
-                            # Collation Field data present in v9.1.x+
-                            # DATA SHAPE: int
-                            elif int(major) >= 9 and int(minor) >= 1:
-                                pass
-
-                            e = Entry(
-                                id=int(id),
-                                filename=filename,
-                                path=e_path,
-                                fields=fields,
-                            )
-                            self.entries.append(e)
-                            self._map_entry_id_to_index(e, -1)
-
-                        end_time = time.time()
-                        logging.info(
-                            f"[LIBRARY] Entries loaded in {(end_time - start_time):.3f} seconds"
+                                            matched = True
+                                            collation_id = c.id
+                                    if not matched:
+                                        c = Collation(
+                                            id=self._next_collation_id,
+                                            title=self.get_field_attr(f, "content")[
+                                                "name"
+                                            ],
+                                            e_ids_and_pages=[],
+                                            sort_order="",
+                                        )
+                                        collation_id = self._next_collation_id
+                                        self._next_collation_id += 1
+                                        c.e_ids_and_pages.append(
+                                            (
+                                                id,
+                                                int(
+                                                    self.get_field_attr(f, "content")[
+                                                        "page"
+                                                    ]
+                                                ),
+                                            )
+                                        )
+                                        self.collations.append(c)
+                                        self._map_collation_id_to_index(c, -1)
+                                    f_id = self.get_field_attr(f, "id")
+                                    f.clear()
+                                    f[int(f_id)] = collation_id
+
+                        e = Entry(
+                            id=int(id),
+                            filename=filename,
+                            path=e_path,
+                            fields=fields,
                         )
+                        self.entries.append(e)
+                        self._map_entry_id_to_index(e, -1)
 
-                    # Parse Collations -----------------------------------------
-                    if "collations" in json_dump.keys():
-                        start_time = time.time()
-                        for collation in json_dump["collations"]:
-                            # Step 1: Create a Collation object and append it to
-                            # the internal Collations list, then map that
-                            # Collation's ID to its index in the Collations list.
-
-                            id = int(collation.get("id", 0))
-                            if id >= self._next_collation_id:
-                                self._next_collation_id = id + 1
-
-                            title = collation.get("title", "")
-                            e_ids_and_pages = collation.get("e_ids_and_pages", [])
-                            sort_order = collation.get("sort_order", "")
-                            cover_id = collation.get("cover_id", -1)
-
-                            c = Collation(
-                                id=id,
-                                title=title,
-                                e_ids_and_pages=e_ids_and_pages,  # type: ignore
-                                sort_order=sort_order,
-                                cover_id=cover_id,
-                            )
+                    end_time = time.time()
+                    logging.info(
+                        f"[LIBRARY] Entries loaded in {(end_time - start_time):.3f} seconds"
+                    )
 
-                            # NOTE: This does NOT use the add_collation_to_library() method
-                            # which is intended to be used at runtime. However, there is
-                            # currently no reason why it couldn't be used here, and is
-                            # instead not used for consistency.
-                            self.collations.append(c)
-                            self._map_collation_id_to_index(c, -1)
-                        end_time = time.time()
-                        logging.info(
-                            f"[LIBRARY] Collations loaded in {(end_time - start_time):.3f} seconds"
+                # Parse Collations -----------------------------------------
+                if "collations" in json_dump.keys():
+                    start_time = time.time()
+                    for collation in json_dump["collations"]:
+                        # Step 1: Create a Collation object and append it to
+                        # the internal Collations list, then map that
+                        # Collation's ID to its index in the Collations list.
+
+                        id = int(collation.get("id", 0))
+                        if id >= self._next_collation_id:
+                            self._next_collation_id = id + 1
+
+                        title = collation.get("title", "")
+                        e_ids_and_pages = collation.get("e_ids_and_pages", [])
+                        sort_order = collation.get("sort_order", "")
+                        cover_id = collation.get("cover_id", -1)
+
+                        c = Collation(
+                            id=id,
+                            title=title,
+                            e_ids_and_pages=e_ids_and_pages,  # type: ignore
+                            sort_order=sort_order,
+                            cover_id=cover_id,
                         )
 
-                    return_code = 1
+                        # NOTE: This does NOT use the add_collation_to_library() method
+                        # which is intended to be used at runtime. However, there is
+                        # currently no reason why it couldn't be used here, and is
+                        # instead not used for consistency.
+                        self.collations.append(c)
+                        self._map_collation_id_to_index(c, -1)
+                    end_time = time.time()
+                    logging.info(
+                        f"[LIBRARY] Collations loaded in {(end_time - start_time):.3f} seconds"
+                    )
+
+                return_code = 1
             except ujson.JSONDecodeError:
                 logging.info("[LIBRARY][ERROR]: Empty JSON file!")
 
         # If the Library is loaded, continue other processes.
         if return_code == 1:
-            (self.library_dir / TS_FOLDER_NAME).mkdir(parents=True, exist_ok=True)
             self._map_filenames_to_entry_ids()
 
         return return_code
@@ -771,18 +825,15 @@ class Library:
         }
 
         print("[LIBRARY] Formatting Tags to JSON...")
+        file_to_save["tags"] = self.verify_default_tags(
+            [tag.compressed_dict() for tag in self.tags]
+        )
 
-        for tag in self.tags:
-            file_to_save["tags"].append(tag.compressed_dict())
-
-        file_to_save["tags"] = self.verify_default_tags(file_to_save["tags"])
         print("[LIBRARY] Formatting Entries to JSON...")
-        for entry in self.entries:
-            file_to_save["entries"].append(entry.compressed_dict())
+        file_to_save["entries"] = [entry.compressed_dict() for entry in self.entries]
 
         print("[LIBRARY] Formatting Collations to JSON...")
-        for collation in self.collations:
-            file_to_save["collations"].append(collation.compressed_dict())
+        file_to_save["collations"] = [c.compressed_dict() for c in self.collations]
 
         print("[LIBRARY] Done Formatting to JSON!")
         return file_to_save
@@ -796,10 +847,10 @@ class Library:
 
         self.verify_ts_folders()
 
-        with open(
-            self.library_dir / TS_FOLDER_NAME / filename, "w", encoding="utf-8"
-        ) as outfile:
-            outfile.flush()
+        # Write to a temporary file first and then swap it into place, so an
+        # interrupted save never leaves behind a truncated library file.
+        temp_path = self.library_dir / TS_FOLDER_NAME / f"{filename}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as outfile:
             ujson.dump(
                 self.to_json(),
                 outfile,
@@ -807,6 +858,7 @@ class Library:
                 escape_forward_slashes=False,
             )
             # , indent=4 <-- How to prettyprint dump
+        os.replace(temp_path, self.library_dir / TS_FOLDER_NAME / filename)
         end_time = time.time()
         logging.info(
             f"[LIBRARY] Library saved to disk in {(end_time - start_time):.3f} seconds"
@@ -819,27 +871,30 @@ class Library:
 
         logging.info(f"[LIBRARY] Saving Library Backup to Disk...")
         start_time = time.time()
-        filename = f'ts_library_backup_{datetime.datetime.utcnow().strftime("%F_%T").replace(":", "")}.json'
-
-        self.verify_ts_folders()
-        with open(
-            self.library_dir / TS_FOLDER_NAME / BACKUP_FOLDER_NAME / filename,
-            "w",
-            encoding="utf-8",
-        ) as outfile:
-            outfile.flush()
-            ujson.dump(
-                self.to_json(),
-                outfile,
-                ensure_ascii=False,
-                escape_forward_slashes=False,
-            )
+        filepath, text = self.serialize_library_backup()
+        filepath.write_text(text, encoding="utf-8")
         end_time = time.time()
         logging.info(
             f"[LIBRARY] Library backup saved to disk in {(end_time - start_time):.3f} seconds"
         )
-        return filename
-        # , indent=4 <-- How to prettyprint dump
+        return filepath.name
+
+    def serialize_library_backup(self) -> tuple[Path, str]:
+        """
+        Serializes the Library for a backup file without writing it, so the text
+        can be written out elsewhere (ex. off the UI thread).
+        Returns the backup filepath, including the date and time, and its JSON text.
+        """
+        filename = f'ts_library_backup_{datetime.datetime.utcnow().strftime("%F_%T").replace(":", "")}.json'
+
+        self.verify_ts_folders()
+        text = ujson.dumps(
+            self.to_json(),
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            # , indent=4 <-- How to prettyprint dump
+        )
+        return self.library_dir / TS_FOLDER_NAME / BACKUP_FOLDER_NAME / filename, text
 
     def clear_internal_vars(self):
         """Clears the internal variables of the Library object."""
@@ -861,6 +916,8 @@ class Library:
         self.filename_to_entry_id_map: dict[Path, int] = {}
         self.ext_list = self.default_ext_exclude_list
 
+        _to_path.cache_clear()
+
         self.tags.clear()
         self._next_tag_id = 1000
         self._tag_strings_to_id_map = {}
@@ -868,6 +925,18 @@ class Library:
         self._tag_id_to_index_map = {}
         self._tag_entry_ref_map.clear()
 
+    def _ext_set(self) -> set[str]:
+        """
+        Returns the extension list as a set for constant time lookups.
+        Extensions are lowercased so that they match files regardless of case.
+        The set is rebuilt only when the contents of the extension list change.
+        """
+        ext_key = tuple(self.ext_list)
+        if ext_key != self._ext_set_key:
+            self._ext_set_key = ext_key
+            self._ext_set_cache = {ext.lower() for ext in ext_key}
+        return self._ext_set_cache
+
     def refresh_dir(self) -> Generator:
         """Scans a directory for files, and adds those relative filenames to internal variables."""
 
@@ -880,44 +949,79 @@ class Library:
         #   - Total file count
         #   - Files without library entries
         # for type in TYPES:
+        ext_set = self._ext_set()
+        excluded_names = {"$RECYCLE.BIN", TS_FOLDER_NAME, "tagstudio_thumbs"}
+
+        # The DirEntry of each new file is kept alongside it for sorting.
+        new_dir_entries: list[os.DirEntry] = []
+        # NOTE: Known files are checked as plain path strings, so only new files
+        # need to be turned into Path objects.
+        known_files = {os.path.normcase(f) for f in self.filename_to_entry_id_map}
+
         start_time = time.time()
-        for f in self.library_dir.glob("**/*"):
+        # NOTE: Walks the tree with os.scandir() rather than Path.glob(), so
+        # excluded folders are pruned before they're descended into and the
+        # file/folder checks use the DirEntry's cached type information.
+        dirs_to_scan: list[tuple[str, str]] = [(os.fspath(self.library_dir), "")]
+        while dirs_to_scan:
+            dir_path, rel_dir = dirs_to_scan.pop()
             try:
-                if (
-                    "$RECYCLE.BIN" not in f.parts
-                    and TS_FOLDER_NAME not in f.parts
-                    and "tagstudio_thumbs" not in f.parts
-                    and not f.is_dir()
-                ):
-                    if f.suffix not in self.ext_list and self.is_exclude_list:
-                        self.dir_file_count += 1
-                        file = f.relative_to(self.library_dir)
-                        if file not in self.filename_to_entry_id_map:
-                            self.files_not_in_library.append(file)
-                    elif f.suffix in self.ext_list and not self.is_exclude_list:
-                        self.dir_file_count += 1
-                        file = f.relative_to(self.library_dir)
-                        try:
-                            _ = self.filename_to_entry_id_map[file]
-                        except KeyError:
-                            # print(file)
-                            self.files_not_in_library.append(file)
+                with os.scandir(dir_path) as it:
+                    dir_entries = list(it)
             except PermissionError:
                 logging.info(
-                    f"The File/Folder {f} cannot be accessed, because it requires higher permission!"
+                    f"The File/Folder {dir_path} cannot be accessed, because it requires higher permission!"
                 )
-            end_time = time.time()
-            # Yield output every 1/30 of a second
-            if (end_time - start_time) > 0.034:
-                yield self.dir_file_count
-                start_time = time.time()
+                continue
+            except OSError:
+                continue
+
+            for dir_entry in dir_entries:
+                if dir_entry.name in excluded_names:
+                    continue
+                try:
+                    is_dir = dir_entry.is_dir()
+                    is_link = is_dir and dir_entry.is_symlink()
+                except OSError:
+                    is_dir = is_link = False
+                if is_dir:
+                    # NOTE: Symlinked folders are skipped rather than followed, as
+                    # Path.glob() did, so links back up the tree can't loop forever.
+                    if not is_link:
+                        dirs_to_scan.append(
+                            (dir_entry.path, os.path.join(rel_dir, dir_entry.name))
+                        )
+                    continue
+
+                # Same rules as Path.suffix.
+                name = dir_entry.name
+                i = name.rfind(".")
+                suffix = name[i:].lower() if 0 < i < len(name) - 1 else ""
+                if (suffix in ext_set) != self.is_exclude_list:
+                    self.dir_file_count += 1
+                    file = os.path.join(rel_dir, name)
+                    if os.path.normcase(file) not in known_files:
+                        self.files_not_in_library.append(Path(file))
+                        new_dir_entries.append(dir_entry)
+                    # Yield output every 1024 files, without a clock call per file.
+                    if self.dir_file_count % 1024 == 0:
+                        yield self.dir_file_count
+        logging.info(
+            f"[LIBRARY] Scanned {self.dir_file_count} files "
+            f"({len(self.files_not_in_library)} new) "
+            f"in {(time.time() - start_time):.3f} seconds"
+        )
         # Sorts the files by date modified, descending.
         if len(self.files_not_in_library) <= 100000:
             try:
-                self.files_not_in_library = sorted(
-                    self.files_not_in_library,
-                    key=lambda t: -(self.library_dir / t).stat().st_ctime,
-                )
+                ctimes = [d.stat().st_ctime for d in new_dir_entries]
+                self.files_not_in_library = [
+                    file
+                    for _, file in sorted(
+                        zip(ctimes, self.files_not_in_library),
+                        key=lambda t: -t[0],
+                    )
+                ]
             except (FileExistsError, FileNotFoundError):
                 print(
                     "[LIBRARY] [ERROR] Couldn't sort files, some were moved during the scanning/sorting process."
@@ -931,39 +1035,72 @@ class Library:
     def refresh_missing_files(self):
         """Tracks the number of Entries that point to an invalid file path."""
         self.missing_files.clear()
-        for i, entry in enumerate(self.entries):
-            full_path = self.library_dir / entry.path / entry.filename
-            if not full_path.is_file():
-                self.missing_files.append(full_path.resolve())
-            yield i
+        # NOTE: Checks the joined path strings directly, since only the paths of
+        # missing files need to become Path objects.
+        library_dir = os.fspath(self.library_dir)
+        # NOTE: The existence checks are split into chunks of 1024 and run on a
+        # thread pool, since os.path.isfile() releases the GIL while it waits on
+        # the disk. Each chunk's paths are only joined once it's submitted, and at
+        # most 32 chunks are in flight, so memory doesn't grow with the Library.
+        # Results are collected in order, and progress is yielded per chunk.
+        pending: deque[tuple[int, list[str], Future[list[bool]]]] = deque()
+
+        def collect_chunk() -> int:
+            start, chunk, are_files = pending.popleft()
+            for full_path, is_file in zip(chunk, are_files.result()):
+                if not is_file:
+                    self.missing_files.append(Path(full_path).resolve())
+            return start + len(chunk) - 1
+
+        with ThreadPoolExecutor() as executor:
+            for start in range(0, len(self.entries), 1024):
+                chunk = [
+                    os.path.join(library_dir, entry.path, entry.filename)
+                    for entry in self.entries[start : start + 1024]
+                ]
+                pending.append((start, chunk, executor.submit(_are_files, chunk)))
+                if len(pending) == 32:
+                    yield collect_chunk()
+            while pending:
+                yield collect_chunk()
 
     def remove_entry(self, entry_id: int) -> None:
         """Removes an Entry from the Library."""
-        # del self.entries[entry_index]
-        # self._map_filenames_to_entry_indices()
+        self.remove_entries([entry_id])
 
+    def remove_entries(self, entry_ids: list[int]) -> None:
+        """
+        Removes a batch of Entries from the Library.
+        The remaining Entries are only remapped once for the whole batch.
+        """
         # Step [1/2]:
-        # Remove this Entry from the Entries list.
-        entry = self.get_entry(entry_id)
-        path = entry.path / entry.filename
-        # logging.info(f'Removing path: {path}')
+        # Unmap each Entry's filepath.
+        for entry_id in entry_ids:
+            self._unmap_entry_filepath(entry_id)
 
-        del self.filename_to_entry_id_map[path]
-
-        del self.entries[self._entry_id_to_index_map[entry_id]]
+        # Step [2/2]:
+        # Remove the Entries from the Entries list and remap the others.
+        self._drop_entries(set(entry_ids))
 
-        # self.entries.remove(self.entries[self._entry_id_to_index_map[entry_id]])
+    def _unmap_entry_filepath(self, entry_id: int) -> None:
+        """
+        Removes an Entry's filepath from filename_to_entry_id_map.
+        Raises a KeyError if either the Entry or its filepath aren't mapped.
+        """
+        entry = self.get_entry(entry_id)
+        del self.filename_to_entry_id_map[entry.path / entry.filename]
 
-        # Step [2/2]:
-        # Remap the other Entry IDs to their new indices in the Entries list.
+    def _drop_entries(self, entry_ids: set[int]) -> None:
+        """
+        Drops Entries from the Entries list in a single pass, rather than searching
+        the list again for each one, then remaps the remaining Entry IDs to their
+        new indices in the Entries list.
+        """
+        self.entries[:] = [e for e in self.entries if e.id not in entry_ids]
         self._entry_id_to_index_map.clear()
         for i, e in enumerate(self.entries):
             self._map_entry_id_to_index(e, i)
 
-        # # Step [3/3]:
-        # # Remap filenames to new indices.
-        # self._map_filenames_to_entry_ids()
-
     def refresh_dupe_entries(self):
         """
         Refreshes the list of duplicate Entries.
@@ -979,17 +1116,11 @@ class Library:
         # Dupe Entries: primary ID : list of [every OTHER entry ID pointing]
 
         for i, e in enumerate(self.entries):
-            file: Path = Path() / e.path / e.filename
-            # If this unique filepath has not been marked as checked,
-            if not registered.get(file, None):
-                # Register the filepath as having been checked, and include
-                # its entry ID as the first entry in the corresponding list.
-                registered[file] = [e.id]
-            # Else if the filepath is already been seen in another entry,
-            else:
-                # Add this new entry ID to the list of entry ID(s) pointing to
-                # the same file.
-                registered[file].append(e.id)
+            # NOTE: Uses the same relative filepath key as filename_to_entry_id_map.
+            file: Path = e.path / e.filename
+            # Register the filepath as having been checked, and add this entry ID
+            # to the list of entry ID(s) pointing to the same file.
+            registered.setdefault(file, []).append(e.id)
             yield i - 1  # The -1 waits for the next step to finish
 
         for k, v in registered.items():
@@ -1010,35 +1141,22 @@ class Library:
         """
 
         logging.info("[LIBRARY] Mirroring Duplicate Entries...")
-        id_to_entry_map: dict = {}
-
         for dupe in self.dupe_entries:
-            # Store the id to entry relationship as the library one is about to
-            # be destroyed.
-            # NOTE: This is not a good solution, but will be upended by the
-            # database migration soon anyways.
-            for id in dupe[1]:
-                id_to_entry_map[id] = self.get_entry(id)
             self.mirror_entry_fields([dupe[0]] + dupe[1])
 
         logging.info(
             "[LIBRARY] Consolidating Entries... (This may take a while for larger libraries)"
         )
+        removed_ids: set[int] = set()
         for i, dupe in enumerate(self.dupe_entries):
             for id in dupe[1]:
-                # NOTE: Instead of using self.remove_entry(id), I'm bypassing it
-                # because it's currently inefficient in how it needs to remap
-                # every ID to every list index. I'm recreating the steps it
-                # takes but in a batch-friendly way here.
-                # NOTE: Couldn't use get_entry(id) because that relies on the
-                # entry's index in the list, which is currently being messed up.
                 logging.info(f"[LIBRARY] Removing Unneeded Entry {id}")
-                self.entries.remove(id_to_entry_map[id])
+                removed_ids.add(id)
             yield i - 1  # The -1 waits for the next step to finish
 
-        self._entry_id_to_index_map.clear()
-        for i, e in enumerate(self.entries, start=0):
-            self._map_entry_id_to_index(e, i)
+        # NOTE: The unneeded Entries share their filepaths with the Entries being
+        # kept, so the filepaths are remapped afterwards instead of unmapped.
+        self._drop_entries(removed_ids)
         self._map_filenames_to_entry_ids()
 
     def refresh_dupe_files(self, results_filepath: str | Path):
@@ -1096,23 +1214,32 @@ class Library:
                 # self.dupe_files.append(full_path)
 
     def remove_missing_files(self):
-        deleted = []
+        # Indices into missing_files of the Entries that were removed.
+        deleted: set[int] = set()
+        # NOTE: Each Entry's filepath is unmapped as it's found, but the Entries
+        # themselves are dropped in one batch at the end, rather than remapping
+        # every remaining Entry once per removal.
+        removed_ids: set[int] = set()
         for i, missing in enumerate(self.missing_files):
             # pb.setValue(i)
             # pb.setLabelText(f'Deleting {i}/{len(self.lib.missing_files)} Unlinked Entries')
             try:
                 id = self.get_entry_id_from_filepath(missing)
                 logging.info(f"Removing Entry ID {id}:\n\t{missing}")
-                self.remove_entry(id)
+                self._unmap_entry_filepath(id)
+                removed_ids.add(id)
                 # self.driver.purge_item_from_navigation(ItemType.ENTRY, id)
-                deleted.append(missing)
+                deleted.add(i)
             except KeyError:
                 logging.info(
                     f'[LIBRARY][ERROR]: "{id}" was reported as missing, but is not in the file_to_entry_id map.'
                 )
             yield (i, id)
-        for d in deleted:
-            self.missing_files.remove(d)
+        self._drop_entries(removed_ids)
+        # Drop the deleted files in one pass rather than one list.remove() each.
+        self.missing_files[:] = [
+            m for i, m in enumerate(self.missing_files) if i not in deleted
+        ]
 
     def remove_missing_matches(self, fixed_indices: list[int]):
         """Removes a list of fixed Entry indices from the internal missing_matches list."""
@@ -1166,8 +1293,6 @@ class Library:
         if self.dupe_entries:
             self.merge_dupe_entries()
 
-        # Remap filenames to entry IDs.
-        self._map_filenames_to_entry_ids()
         # TODO - the type here doesnt match but I cant reproduce calling this
         self.remove_missing_matches(fixed_indices)
 
@@ -1184,22 +1309,23 @@ class Library:
         # for file in self.missing_files:
         path = Path(file)
         for root, dirs, files in os.walk(self.library_dir):
-            for f in files:
-                # print(f'{tail} --- {f}')
-                if path.name == f and "$recycle.bin" not in str(root).lower():
-                    # self.fixed_files.append(tail)
+            # Prune Recycle Bins so they're never descended into.
+            dirs[:] = [d for d in dirs if "$recycle.bin" not in d.lower()]
+            # print(f'{tail} --- {f}')
+            if path.name in files and "$recycle.bin" not in str(root).lower():
+                # self.fixed_files.append(tail)
 
-                    new_path = Path(root).relative_to(self.library_dir)
+                new_path = Path(root).relative_to(self.library_dir)
 
-                    matches.append(new_path)
+                matches.append(new_path)
 
-                    # if file not in matches.keys():
-                    # 	matches[file] = []
-                    # matches[file].append(new_path)
+                # if file not in matches.keys():
+                # 	matches[file] = []
+                # matches[file].append(new_path)
 
-                    print(
-                        f"[LIBRARY] MATCH: {file} \n\t-> {self.library_dir / new_path / path.name}\n"
-                    )
+                print(
+                    f"[LIBRARY] MATCH: {file} \n\t-> {self.library_dir / new_path / path.name}\n"
+                )
 
         if not matches:
             print(f"[LIBRARY] No matches found for: {file}")
@@ -1248,22 +1374,19 @@ class Library:
         """
         self._tag_entry_ref_map.clear()
         self.tag_entry_refs.clear()
+        ref_map = self._tag_entry_ref_map
         local_hits: set = set()
 
         for entry in self.entries:
             local_hits.clear()
             if entry.fields:
                 for field in entry.fields:
-                    if self.get_field_attr(field, "type") == "tag_box":
-                        for tag_id in self.get_field_attr(field, "content"):
-                            local_hits.add(tag_id)
+                    field_id = next(iter(field))
+                    if self.get_field_obj(field_id)["type"] == "tag_box":
+                        local_hits.update(field[field_id])
 
-            for hit in list(local_hits):
-                try:
-                    _ = self._tag_entry_ref_map[hit]
-                except KeyError:
-                    self._tag_entry_ref_map[hit] = 0
-                self._tag_entry_ref_map[hit] += 1
+            for hit in local_hits:
+                ref_map[hit] = ref_map.get(hit, 0) + 1
 
         # keys = list(self.tag_entry_ref_map.keys())
         # values = list(self.tag_entry_ref_map.values())
@@ -1276,23 +1399,31 @@ class Library:
         self.entries.append(entry)
         self._map_entry_id_to_index(entry, -1)
 
+    def add_entries_to_library(self, entries: list[Entry]) -> None:
+        """Adds a batch of new Entries to the Library."""
+        start = len(self.entries)
+        self.entries.extend(entries)
+        # Both maps are extended in bulk rather than one mapping call per Entry.
+        self._entry_id_to_index_map.update(
+            zip([e.id for e in entries], range(start, len(self.entries)))
+        )
+        self.filename_to_entry_id_map.update(
+            [(e.path / e.filename, e.id) for e in entries]
+        )
+
     def add_new_files_as_entries(self) -> list[int]:
         """Adds files from the `files_not_in_library` list to the Library as Entries. Returns list of added indices."""
-        new_ids: list[int] = []
-        for file in self.files_not_in_library:
-            path = Path(file)
-            # print(os.path.split(file))
-            entry = Entry(
-                id=self._next_entry_id, filename=path.name, path=path.parent, fields=[]
-            )
-            self._next_entry_id += 1
-            self.add_entry_to_library(entry)
-            new_ids.append(entry.id)
-        self._map_filenames_to_entry_ids()
-        self.files_not_in_library.clear()
-        return new_ids
-
+        # The new Entries take a contiguous block of IDs, handed out up front.
+        start_id = self._next_entry_id
+        new_entries: list[Entry] = [
+            Entry(id=id, filename=path.name, path=path.parent, fields=[])
+            for id, path in enumerate(map(Path, self.files_not_in_library), start_id)
+        ]
+        self._next_entry_id += len(new_entries)
+        # Only the new Entries need mapping, rather than remapping the whole Library.
+        self.add_entries_to_library(new_entries)
         self.files_not_in_library.clear()
+        return list(range(start_id, self._next_entry_id))
 
     def get_entry(self, entry_id: int) -> Entry:
         """Returns an Entry object given an Entry ID."""
@@ -1312,13 +1443,13 @@ class Library:
     # @deprecated('Use new Entry ID system.')
     def get_entry_id_from_filepath(self, filename: Path):
         """Returns an Entry ID given the full filepath it points to."""
-        try:
-            if self.entries:
-                return self.filename_to_entry_id_map[
-                    Path(filename).relative_to(self.library_dir)
-                ]
-        except KeyError:
-            return -1
+        if self.entries:
+            # Paths that are already Path objects are used as-is.
+            if not isinstance(filename, Path):
+                filename = Path(filename)
+            return self.filename_to_entry_id_map.get(
+                filename.relative_to(self.library_dir), -1
+            )
 
     def search_library(
         self,
@@ -1335,7 +1466,7 @@ class Library:
 
         # self.filtered_entries.clear()
         results: list[tuple[ItemType, int]] = []
-        collations_added = []
+        collations_added: set[int] = set()
         # print(f"Searching Library with query: {query} search_mode: {search_mode}")
         if query:
             # start_time = time.time()
@@ -1357,14 +1488,12 @@ class Library:
             # Preprocess the Tag terms.
             if query_words:
                 # print(query_words, self._tag_strings_to_id_map)
-                for i, term in enumerate(query_words):
-                    for j, term in enumerate(query_words):
-                        if (
-                            query_words[i : j + 1]
-                            and " ".join(query_words[i : j + 1])
-                            in self._tag_strings_to_id_map
-                        ):
-                            all_tag_terms.append(" ".join(query_words[i : j + 1]))
+                # NOTE: Only spans where j >= i are non-empty, so the rest are skipped.
+                for i in range(len(query_words)):
+                    for j in range(i, len(query_words)):
+                        term = " ".join(query_words[i : j + 1])
+                        if term in self._tag_strings_to_id_map:
+                            all_tag_terms.append(term)
                         # print(all_tag_terms)
 
                 # This gets rid of any accidental term inclusions because they were words
@@ -1379,26 +1508,51 @@ class Library:
 
             # print(all_tag_terms)
 
+            # NOTE: Build the lookups used per Entry once, so that checking each
+            # Entry doesn't scan the extension or missing file lists.
+            ext_set = self._ext_set()
+            missing_files = set(self.missing_files) if only_missing else set()
+
+            # The Tag ID cluster of each term is the same for every Entry, so
+            # expand them once up front.
+            term_clusters: dict[str, set[int]] = {}
+            for term in all_tag_terms:
+                cluster: set[int] = set()
+                # Add the immediate associated Tags to the set (ex. Name, Alias hits)
+                # Since this term could technically map to multiple IDs, iterate over it
+                # (You're 99.9999999% likely to just get 1 item)
+                for id in self._tag_strings_to_id_map[term]:
+                    cluster.add(id)
+                    cluster.update(self.get_tag_cluster(id))
+                term_clusters[term] = cluster
+
             # non_entry_count = 0
             # Iterate over all Entries =============================================================
             for entry in self.entries:
-                allowed_ext: bool = entry.filename.suffix not in self.ext_list
+                # Results appended from this point on belong to this Entry.
+                entry_results_start = len(results)
+                allowed_ext: bool = entry.filename.suffix.lower() not in ext_set
                 # try:
                 # entry: Entry = self.entries[self.file_to_library_index_map[self._source_filenames[i]]]
                 # print(f'{entry}')
 
                 if allowed_ext == self.is_exclude_list:
-                    # If the entry has tags of any kind, append them to this main tag list.
-                    entry_tags: list[int] = []
+                    # If the entry has tags of any kind, add them to this main tag set.
+                    # NOTE: A set, since every term's cluster is checked against it.
+                    entry_tags: set[int] = set()
                     entry_authors: list[str] = []
+                    # NOTE: Collations are gathered in the same pass, so that adding
+                    # the Entry to the results doesn't walk its fields again.
+                    entry_collations: list[int] = []
                     if entry.fields:
                         for field in entry.fields:
-                            field_id = list(field.keys())[0]
-                            if self.get_field_obj(field_id)["type"] == "tag_box":
-                                entry_tags.extend(field[field_id])
-                            if self.get_field_obj(field_id)["name"] == "Author":
-                                entry_authors.extend(field[field_id])
-                            if self.get_field_obj(field_id)["name"] == "Artist":
+                            field_id = next(iter(field))
+                            field_type = self.get_field_obj(field_id)["type"]
+                            if field_type == "tag_box":
+                                entry_tags.update(field[field_id])
+                            elif field_type == "collation":
+                                entry_collations.append(field[field_id])
+                            elif field_id in (FieldID.AUTHOR, FieldID.ARTIST):
                                 entry_authors.extend(field[field_id])
 
                     # print(f'Entry Tags: {entry_tags}')
@@ -1417,7 +1571,7 @@ class Library:
                     elif only_missing:
                         if (
                             self.library_dir / entry.path / entry.filename
-                        ).resolve() in self.missing_files:
+                        ).resolve() in missing_files:
                             results.append((ItemType.ENTRY, entry.id))
 
                     # elif query == "archived":
@@ -1429,11 +1583,10 @@ class Library:
                     # NOTE: This searches path and filenames.
 
                     if allow_adv:
-                        if [q for q in query_words if (q in str(entry.path).lower())]:
-                            results.append((ItemType.ENTRY, entry.id))
-                        elif [
-                            q for q in query_words if (q in str(entry.filename).lower())
-                        ]:
+                        # The path strings are built once per Entry, not once per word.
+                        path = str(entry.path).lower()
+                        filename = str(entry.filename).lower()
+                        if any(q in path or q in filename for q in query_words):
                             results.append((ItemType.ENTRY, entry.id))
                     elif tag_only:
                         if entry.has_tag(self, int(query_words[0])):
@@ -1447,25 +1600,12 @@ class Library:
                             # self.filter_entries.append()
                             # self.filtered_file_list.append(file)
                             # results.append((SearchItemType.ENTRY, entry.id))
-                            added = False
-                            for f in entry.fields:
-                                if self.get_field_attr(f, "type") == "collation":
-                                    if (
-                                        self.get_field_attr(f, "content")
-                                        not in collations_added
-                                    ):
-                                        results.append(
-                                            (
-                                                ItemType.COLLATION,
-                                                self.get_field_attr(f, "content"),
-                                            )
-                                        )
-                                        collations_added.append(
-                                            self.get_field_attr(f, "content")
-                                        )
-                                    added = True
+                            for collation_id in entry_collations:
+                                if collation_id not in collations_added:
+                                    results.append((ItemType.COLLATION, collation_id))
+                                    collations_added.add(collation_id)
 
-                            if not added:
+                            if not entry_collations:
                                 results.append((ItemType.ENTRY, entry.id))
 
                         if search_mode == SearchMode.AND:  # Include all terms
@@ -1474,18 +1614,9 @@ class Library:
                             for term in all_tag_terms:
                                 # If the term from the previous loop was already verified:
                                 if not failure_to_union_terms:
-                                    cluster: set = set()
-                                    # Add the immediate associated Tags to the set (ex. Name, Alias hits)
-                                    # Since this term could technically map to multiple IDs, iterate over it
-                                    # (You're 99.9999999% likely to just get 1 item)
-                                    for id in self._tag_strings_to_id_map[term]:
-                                        cluster.add(id)
-                                        cluster = cluster.union(
-                                            set(self.get_tag_cluster(id))
-                                        )
-                                    # print(f'Full Cluster: {cluster}')
+                                    # print(f'Full Cluster: {term_clusters[term]}')
                                     # For each of the Tag IDs in the term's ID cluster:
-                                    for t in cluster:
+                                    for t in term_clusters[term]:
                                         # Assume that this ID from the cluster is not in the Entry.
                                         # Wait to see if proven wrong.
                                         failure_to_union_terms = True
@@ -1503,18 +1634,22 @@ class Library:
                                 add_entry(entry)
 
                         if search_mode == SearchMode.OR:  # Include any terms
-                            # For each verified, extracted Tag term.
-                            for term in all_tag_terms:
-                                # Add the immediate associated Tags to the set (ex. Name, Alias hits)
-                                # Since this term could technically map to multiple IDs, iterate over it
-                                # (You're 99.9999999% likely to just get 1 item)
-                                for id in self._tag_strings_to_id_map[term]:
-                                    # If the ID actually is in the Entry,
-                                    if id in entry_tags:
-                                        # check if result already contains the entry
-                                        if (ItemType.ENTRY, entry.id) not in results:
-                                            add_entry(entry)
-                                        break
+                            # Add the immediate associated Tags to the set (ex. Name, Alias hits)
+                            # Since a term could technically map to multiple IDs, iterate over it
+                            # (You're 99.9999999% likely to just get 1 item)
+                            # NOTE: Stops at the first matching ID, rather than checking
+                            # the results again for every remaining matching term.
+                            if any(
+                                id in entry_tags
+                                for term in all_tag_terms
+                                for id in self._tag_strings_to_id_map[term]
+                            ):
+                                # check if result already contains the entry
+                                # (ex. from a special flag like "no author")
+                                if (ItemType.ENTRY, entry.id) not in results[
+                                    entry_results_start:
+                                ]:
+                                    add_entry(entry)
 
                 # sys.stdout.write(
                 #     f'\r[INFO][FILTER]: {len(self.filtered_file_list)} matches found')
@@ -1537,25 +1672,18 @@ class Library:
             # if not self.filtered_entries:
             # 	print("[INFO][FILTER]: Filter returned no results.")
         else:
+            ext_set = self._ext_set()
             for entry in self.entries:
                 added = False
-                allowed_ext = entry.filename.suffix not in self.ext_list
+                allowed_ext = entry.filename.suffix.lower() not in ext_set
                 if allowed_ext == self.is_exclude_list:
                     for f in entry.fields:
-                        if self.get_field_attr(f, "type") == "collation":
-                            if (
-                                self.get_field_attr(f, "content")
-                                not in collations_added
-                            ):
-                                results.append(
-                                    (
-                                        ItemType.COLLATION,
-                                        self.get_field_attr(f, "content"),
-                                    )
-                                )
-                                collations_added.append(
-                                    self.get_field_attr(f, "content")
-                                )
+                        field_id = next(iter(f))
+                        if self.get_field_obj(field_id)["type"] == "collation":
+                            collation_id = f[field_id]
+                            if collation_id not in collations_added:
+                                results.append((ItemType.COLLATION, collation_id))
+                                collations_added.add(collation_id)
                             added = True
 
                     if not added:
@@ -1606,26 +1734,25 @@ class Library:
         # it misses stuff like Archive (id 0) so here's this as a catch-all.
 
         if not query:
-            all: list[int] = []
-            for tag in self.tags:
-                if ignore_builtin and tag.id >= 1000:
-                    all.append(tag.id)
-                elif not ignore_builtin:
-                    all.append(tag.id)
-            return all
+            # NOTE: Built-in Tags have IDs below 1000.
+            return [tag.id for tag in self.tags if not ignore_builtin or tag.id >= 1000]
 
         # Direct port from Version 8 ===========================================
         # TODO: Make this more efficient (if needed)
         # ids: list[int] = []
         id_weights: list[tuple[int, int]] = []
+        # Sets mirroring id_weights while it's built, for constant time checks.
+        weighted_ids: set[int] = set()
+        id_weights_set: set[tuple[int, int]] = set()
         # partial_id_weights: list[int] = []
         priority_ids: list[int] = []
         # print(f'Query: \"{query}\" -------------------------------------')
+        # NOTE: The mapped tag strings are already stripped and lowercased by
+        # _map_tag_strings_to_tag_id(), so only the query needs normalizing.
+        query = strip_punctuation(query).lower()
         for string in self._tag_strings_to_id_map:  # O(n), n = tags
             exact_match: bool = False
             partial_match: bool = False
-            query = strip_punctuation(query).lower()
-            string = strip_punctuation(string).lower()
 
             if query == string:
                 exact_match = True
@@ -1638,33 +1765,32 @@ class Library:
             if exact_match or partial_match:
                 # Avg O(1), usually 1 item
                 for tag_id in self._tag_strings_to_id_map[string]:
-                    proceed: bool = False
-                    if ignore_builtin and tag_id >= 1000:
-                        proceed = True
-                    elif not ignore_builtin:
-                        proceed = True
-
-                    if proceed:
-                        if tag_id not in [x[0] for x in id_weights]:
+                    if not ignore_builtin or tag_id >= 1000:
+                        if tag_id not in weighted_ids:
                             if exact_match:
                                 # print(f'[{query}] EXACT MATCH:')
                                 # print(self.get_tag_from_id(tag_id).display_name(self))
                                 # print('')
                                 # time.sleep(0.1)
                                 priority_ids.append(tag_id)
-                                id_weights.append((tag_id, 100000000))
+                                id_weight = (tag_id, 100000000)
                             else:
                                 # print(f'[{query}] Partial Match:')
                                 # print(self.get_tag_from_id(tag_id).display_name(self))
                                 # print('')
                                 # time.sleep(0.1)
                                 # ids.append(id)
-                                id_weights.append((tag_id, 0))
+                                id_weight = (tag_id, 0)
+                            id_weights.append(id_weight)
+                            weighted_ids.add(tag_id)
+                            id_weights_set.add(id_weight)
                         # O(m), m = # of references
                         if include_cluster:
                             for id in self.get_tag_cluster(tag_id):
-                                if (id, 0) not in id_weights:
+                                if (id, 0) not in id_weights_set:
                                     id_weights.append((id, 0))
+                                    weighted_ids.add(id)
+                                    id_weights_set.add((id, 0))
 
         # Contextual Weighing
         if context and (
@@ -1695,20 +1821,21 @@ class Library:
             # time.sleep(3)
             # for term in context:
             # 	context_ids += self.filter_tags(query=term, include_cluster=True, ignore_builtin=ignore_builtin)
+            # Weighted Tags share much of their clusters, so each Tag's children
+            # are only gathered once per search.
+            child_tag_ids: dict[int, list[int]] = {}
             for i, idw in enumerate(id_weights, start=0):
                 weight: int = 0
                 tag_strings: list[str] = []
-                subtag_ids: list[int] = self.get_all_child_tag_ids(idw[0])
-                for id in self.get_tag_cluster(idw[0]):
-                    subtag_ids += self.get_all_child_tag_ids(id)
-                subtag_ids = list(set(subtag_ids))
+                subtag_ids: set[int] = set()
+                for id in (idw[0], *self.get_tag_cluster(idw[0])):
+                    if id not in child_tag_ids:
+                        child_tag_ids[id] = self.get_all_child_tag_ids(id)
+                    subtag_ids.update(child_tag_ids[id])
 
                 for sub_id in subtag_ids:
-                    tag_strings += (
-                        [self.get_tag(sub_id).name]
-                        + [self.get_tag(sub_id).shorthand]
-                        + self.get_tag(sub_id).aliases
-                    )
+                    sub_tag = self.get_tag(sub_id)
+                    tag_strings += [sub_tag.name, sub_tag.shorthand] + sub_tag.aliases
 
                 # for id in self.get_tag_cluster(idw[0]):
                 # 	tag_strings += [self.get_tag_from_id(id).name] + [self.get_tag_from_id(id).shorthand] + self.get_tag_from_id(id).aliases
@@ -1740,37 +1867,45 @@ class Library:
         # if len(id_weights) > 1:
         # 	print(f'Context Weights: \"{id_weights}\"')
 
-        final: list[int] = []
+        # NOTE: dict.fromkeys() drops duplicate IDs while keeping the weighted order.
+        final: list[int] = list(dict.fromkeys(idw[0] for idw in id_weights))
 
         # if context and id_weights:
         # 	time.sleep(3)
-        [final.append(idw[0]) for idw in id_weights if idw[0] not in final]  # type: ignore
         # print(f'Final IDs: \"{[self.get_tag_from_id(id).display_name(self) for id in final]}\"')
         # print('')
         return final
 
     def get_all_child_tag_ids(self, tag_id: int) -> list[int]:
-        """Recursively traverse a Tag's subtags and return a list of all children tags."""
-        subtag_ids: list[int] = []
-        if self.get_tag(tag_id).subtag_ids:
-            for sub_id in self.get_tag(tag_id).subtag_ids:
-                if sub_id not in subtag_ids:
-                    subtag_ids.append(sub_id)
-                    subtag_ids += self.get_all_child_tag_ids(sub_id)
-        else:
+        """Traverse a Tag's subtags and return a list of all children tags."""
+        root_subtag_ids = self.get_tag(tag_id).subtag_ids
+        if not root_subtag_ids:
             return [tag_id]
 
+        # NOTE: Walks the subtag tree with an explicit stack, visiting each Tag
+        # once. This keeps shared subtags from being expanded again and stops
+        # subtag cycles from recursing forever.
+        subtag_ids: list[int] = []
+        visited: set[int] = set()
+        stack: list[int] = list(reversed(root_subtag_ids))
+        while stack:
+            sub_id = stack.pop()
+            if sub_id not in visited:
+                visited.add(sub_id)
+                subtag_ids.append(sub_id)
+                stack.extend(reversed(self.get_tag(sub_id).subtag_ids))
+
         return subtag_ids
 
     def filter_field_templates(self, query: str) -> list[int]:
         """Returns a list of Field Template IDs returned from a string query."""
 
-        matches: list[int] = []
-        for ft in self.default_fields:
-            if ft["name"].lower().startswith(query.lower()):
-                matches.append(ft["id"])
-
-        return matches
+        query = query.lower()
+        return [
+            ft["id"]
+            for ft in self.default_fields
+            if ft["name"].lower().startswith(query)
+        ]
 
     def update_tag(self, tag: Tag) -> None:
         """
@@ -1791,28 +1926,7 @@ class Library:
         # Remember that _tag_names_to_tag_id_map maps strings to a LIST of ids.
         # print(
         #     f'Removing connection from "{old_tag.name.lower()}" to {old_tag.id} in {self._tag_names_to_tag_id_map[old_tag.name.lower()]}')
-        old_name: str = strip_punctuation(old_tag.name).lower()
-        self._tag_strings_to_id_map[old_name].remove(old_tag.id)
-        # Delete the map key if it doesn't point to any other IDs.
-        if not self._tag_strings_to_id_map[old_name]:
-            del self._tag_strings_to_id_map[old_name]
-        if old_tag.shorthand:
-            old_sh: str = strip_punctuation(old_tag.shorthand).lower()
-            # print(
-            #     f'Removing connection from "{old_tag.shorthand.lower()}" to {old_tag.id} in {self._tag_names_to_tag_id_map[old_tag.shorthand.lower()]}')
-            self._tag_strings_to_id_map[old_sh].remove(old_tag.id)
-            # Delete the map key if it doesn't point to any other IDs.
-            if not self._tag_strings_to_id_map[old_sh]:
-                del self._tag_strings_to_id_map[old_sh]
-        if old_tag.aliases:
-            for alias in old_tag.aliases:
-                old_a: str = strip_punctuation(alias).lower()
-                # print(
-                #     f'Removing connection from "{alias.lower()}" to {old_tag.id} in {self._tag_names_to_tag_id_map[alias.lower()]}')
-                self._tag_strings_to_id_map[old_a].remove(old_tag.id)
-                # Delete the map key if it doesn't point to any other IDs.
-                if not self._tag_strings_to_id_map[old_a]:
-                    del self._tag_strings_to_id_map[old_a]
+        self._unmap_tag_strings_from_tag_id(old_tag)
         # then add new reference to this id at map[new names]
         # print(f'Mapping new names for "{tag.name.lower()}" (ID: {tag.id})')
         self._map_tag_strings_to_tag_id(tag)
@@ -1831,11 +1945,11 @@ class Library:
         # instead of literally just deleting the whole map and building it again
         # print('Reticulating Splines...')
         self._tag_id_to_cluster_map.clear()
-        for tag in self.tags:
-            self._map_tag_id_to_cluster(tag)
-            # print('Splines Reticulated.')
-
-            self._map_tag_id_to_cluster(tag)
+        # NOTE: Each Tag's closure only needs to be walked once; a second pass
+        # would find every ID already in its clusters.
+        for t in self.tags:
+            self._map_tag_id_to_cluster(t)
+        # print('Splines Reticulated.')
 
     def remove_tag(self, tag_id: int) -> None:
         """
@@ -1849,21 +1963,20 @@ class Library:
         for e in self.entries:
             if e.fields:
                 for f in e.fields:
-                    if self.get_field_attr(f, "type") == "tag_box":
-                        if tag_id in self.get_field_attr(f, "content"):
-                            self.get_field_attr(f, "content").remove(tag.id)
+                    field_id = next(iter(f))
+                    if self.get_field_obj(field_id)["type"] == "tag_box":
+                        if tag_id in f[field_id]:
+                            f[field_id].remove(tag.id)
 
         # Step [2/7]:
         # Remove from Subtags.
         for t in self.tags:
-            if t.subtag_ids:
-                if tag_id in t.subtag_ids:
-                    t.subtag_ids.remove(tag.id)
+            if tag_id in t.subtag_ids:
+                t.subtag_ids.remove(tag.id)
 
         # Step [3/7]:
         # Remove ID -> cluster reference.
-        if tag_id in self._tag_id_to_cluster_map:
-            del self._tag_id_to_cluster_map[tag.id]
+        self._tag_id_to_cluster_map.pop(tag.id, None)
         # Remove mentions of this ID in all clusters.
         for key, values in self._tag_id_to_cluster_map.items():
             if tag_id in values:
@@ -1871,18 +1984,17 @@ class Library:
 
         # Step [4/7]:
         # Remove mapping of this ID to its index in the tags list.
-        if tag.id in self._tag_id_to_index_map:
-            del self._tag_id_to_index_map[tag.id]
+        index: int = self._tag_id_to_index_map.pop(tag.id)
 
         # Step [5/7]:
         # Remove this Tag from the tags list.
-        self.tags.remove(tag)
+        del self.tags[index]
 
         # Step [6/7]:
         # Remap the other Tag IDs to their new indices in the tags list.
-        self._tag_id_to_index_map.clear()
-        for i, t in enumerate(self.tags):
-            self._map_tag_id_to_index(t, i)
+        # NOTE: Only the Tags after the removed one have moved.
+        for i in range(index, len(self.tags)):
+            self._map_tag_id_to_index(self.tags[i], i)
 
         # Step [7/7]:
         # Remap all existing Tag names.
@@ -1893,45 +2005,83 @@ class Library:
     def get_tag_ref_count(self, tag_id: int) -> tuple[int, int]:
         """Returns an int tuple (entry_ref_count, subtag_ref_count) of Tag reference counts."""
         entry_ref_count: int = 0
-        subtag_ref_count: int = 0
 
         for e in self.entries:
             if e.fields:
                 for f in e.fields:
-                    if self.get_field_attr(f, "type") == "tag_box":
-                        if tag_id in self.get_field_attr(f, "content"):
+                    field_id = next(iter(f))
+                    if self.get_field_obj(field_id)["type"] == "tag_box":
+                        if tag_id in f[field_id]:
                             entry_ref_count += 1
                             break
 
-        for t in self.tags:
-            if t.subtag_ids:
-                if tag_id in t.subtag_ids:
-                    subtag_ref_count += 1
+        subtag_ref_count: int = sum(tag_id in t.subtag_ids for t in self.tags)
 
         # input()
         return (entry_ref_count, subtag_ref_count)
 
     def update_entry_path(self, entry_id: int, path: str | Path) -> None:
         """Updates an Entry's path."""
-        self.get_entry(entry_id).path = Path(path)
+        entry = self.get_entry(entry_id)
+        old_filepath = entry.path / entry.filename
+        path = path if isinstance(path, Path) else Path(path)
+        if path == entry.path and self._is_filepath_mapped(entry, old_filepath):
+            return
+        entry.path = path
+        self._remap_entry_filepath(entry, old_filepath)
 
     def update_entry_filename(self, entry_id: int, filename: str | Path) -> None:
         """Updates an Entry's filename."""
-        self.get_entry(entry_id).filename = Path(filename)
+        entry = self.get_entry(entry_id)
+        old_filepath = entry.path / entry.filename
+        filename = filename if isinstance(filename, Path) else Path(filename)
+        if filename == entry.filename and self._is_filepath_mapped(entry, old_filepath):
+            return
+        entry.filename = filename
+        self._remap_entry_filepath(entry, old_filepath)
+
+    def _is_filepath_mapped(self, entry: Entry, filepath: Path) -> bool:
+        """
+        Returns whether filename_to_entry_id_map already maps the filepath to the Entry.
+        Updates that leave an already mapped filepath unchanged have nothing to do.
+        """
+        return self.filename_to_entry_id_map.get(filepath) == entry.id
+
+    def _remap_entry_filepath(self, entry: Entry, old_filepath: Path) -> None:
+        """
+        Moves an Entry's filename_to_entry_id_map key from its old filepath to its
+        current one, keeping filepath lookups valid without remapping every Entry.
+        """
+        if self._is_filepath_mapped(entry, old_filepath):
+            del self.filename_to_entry_id_map[old_filepath]
+        self.filename_to_entry_id_map[entry.path / entry.filename] = entry.id
 
     def update_entry_field(self, entry_id: int, field_index: int, content, mode: str):
         """Updates an Entry's specific field. Modes: append, remove, replace."""
 
-        field_id: int = list(self.get_entry(entry_id).fields[field_index].keys())[0]
-        if mode.lower() == "append" or mode.lower() == "extend":
-            for i in content:
-                if i not in self.get_entry(entry_id).fields[field_index][field_id]:
-                    self.get_entry(entry_id).fields[field_index][field_id].append(i)
-        elif mode.lower() == "replace":
-            self.get_entry(entry_id).fields[field_index][field_id] = content
-        elif mode.lower() == "remove":
+        # Look the field up once, rather than resolving the Entry again per item.
+        field = self.get_entry(entry_id).fields[field_index]
+        field_id: int = next(iter(field))
+        mode = mode.lower()
+        if mode == "append" or mode == "extend":
+            items = field[field_id]
+            if self.get_field_obj(field_id)["type"] == "tag_box":
+                # Tag IDs are ints, so the ones already present are kept in a set.
+                existing = set(items)
+                for i in content:
+                    if i not in existing:
+                        items.append(i)
+                        existing.add(i)
+            else:
+                # Other field types may hold unhashable items (ex. legacy lists).
+                for i in content:
+                    if i not in items:
+                        items.append(i)
+        elif mode == "replace":
+            field[field_id] = content
+        elif mode == "remove":
             for i in content:
-                self.get_entry(entry_id).fields[field_index][field_id].remove(i)
+                field[field_id].remove(i)
 
     def does_field_content_exist(self, entry_id: int, field_id: int, content) -> bool:
         """Returns whether or not content exists in a specific entry field type."""
@@ -2089,15 +2239,20 @@ class Library:
 
     def add_field_to_entry(self, entry_id: int, field_id: int) -> None:
         """Adds an empty Field, specified by Field ID, to an Entry via its index."""
-        # entry = self.entries[entry_index]
-        entry = self.get_entry(entry_id)
+        self.add_field_to_entries([entry_id], field_id)
+
+    def add_field_to_entries(self, entry_ids: list[int], field_id: int) -> None:
+        """
+        Adds an empty Field, specified by Field ID, to each of the given Entries.
+        The Field template is only resolved once for the whole batch.
+        """
+        entries = [self.get_entry(entry_id) for entry_id in entry_ids]
         field_type = self.get_field_obj(field_id)["type"]
-        if field_type in TEXT_FIELDS:
-            entry.fields.append({int(field_id): ""})
-        elif field_type == "tag_box":
-            entry.fields.append({int(field_id): []})
-        elif field_type == "datetime":
-            entry.fields.append({int(field_id): ""})
+        field_id = int(field_id)
+        if factory := _FIELD_CONTENT_FACTORIES.get(field_type):
+            # Called per Entry so each one gets its own content (ex. tag lists).
+            for entry in entries:
+                entry.fields.append({field_id: factory()})
         else:
             logging.info(
                 f"[LIBRARY][ERROR]: Unknown field id attempted to be added to entry: {field_id}"
@@ -2107,52 +2262,62 @@ class Library:
         """Combines and mirrors all fields across a list of given Entry IDs."""
 
         all_fields: list = []
-        all_ids: list = []  # Parallel to all_fields
+        # Map of each tag_box Field ID to the index of its merged field in all_fields.
+        tag_box_indices: dict[int, int] = {}
+        # (Field ID, content) keys of every other field already in all_fields.
+        #   Used for O(1) duplicate checks instead of comparing against every field.
+        field_keys: set[tuple] = set()
+        # Resolve every Entry once, for both the merge and the write-back.
+        entries: list[Entry] = [
+            entry for id in entry_ids if (entry := self.get_entry(id))
+        ]
         # Extract and merge all fields from all given Entries.
-        for id in entry_ids:
-            if id:
-                entry = self.get_entry(id)
-                if entry and entry.fields:
-                    for field in entry.fields:
+        for entry in entries:
+            if entry.id and entry.fields:
+                for field in entry.fields:
+                    # Fields only have the one key, so read it directly.
+                    raw_id = next(iter(field))
+                    field_id = int(raw_id)
+                    content = field[raw_id]
+                    if self.get_field_obj(raw_id)["type"] == "tag_box":
                         # First checks if their are matching tag_boxes to append to
-                        if (
-                            self.get_field_attr(field, "type") == "tag_box"
-                            and self.get_field_attr(field, "id") in all_ids
-                        ):
-                            content = self.get_field_attr(field, "content")
+                        if field_id in tag_box_indices:
+                            tags = all_fields[tag_box_indices[field_id]][field_id]
                             for i in content:
-                                id = int(self.get_field_attr(field, "id"))
-                                field_index = all_ids.index(id)
-                                if i not in all_fields[field_index][id]:
-                                    all_fields[field_index][id].append(i)
-                        # If not, go ahead and whichever new field.
-                        elif field not in all_fields:
+                                if i not in tags:
+                                    tags.append(i)
+                        else:
+                            tag_box_indices[field_id] = len(all_fields)
+                            all_fields.append(field)
+                    # If not, go ahead and whichever new field.
+                    else:
+                        try:
+                            is_new = (field_id, content) not in field_keys
+                            field_keys.add((field_id, content))
+                        except TypeError:
+                            # Unhashable content (ex. lists or dicts in unknown
+                            # field types) is compared against every field instead.
+                            is_new = field not in all_fields
+                        if is_new:
                             all_fields.append(field)
-                            all_ids.append(int(self.get_field_attr(field, "id")))
 
-        # Replace each Entry's fields with the new merged ones.
-        for id in entry_ids:
-            entry = self.get_entry(id)
-            if entry:
-                entry.fields = all_fields
-
-                # TODO: Replace this and any in CLI with a proper user-defined
-                # field storing method.
-                order: list[int] = (
-                    [0]
-                    + [1, 2]
-                    + [9, 17, 18, 19, 20]
-                    + [10, 14, 11, 12, 13, 22]
-                    + [4, 5]
-                    + [8, 7, 6]
-                    + [3, 21]
-                )
+        # TODO: Replace this and any in CLI with a proper user-defined
+        # field storing method.
+        order: list[int] = (
+            [0]
+            + [1, 2]
+            + [9, 17, 18, 19, 20]
+            + [10, 14, 11, 12, 13, 22]
+            + [4, 5]
+            + [8, 7, 6]
+            + [3, 21]
+        )
+        # Every Entry gets the same merged fields, so they only need sorting once.
+        all_fields = self._sorted_fields(all_fields, order)
 
-                # NOTE: This code is copied from the sort_fields() method.
-                entry.fields = sorted(
-                    entry.fields,
-                    key=lambda x: order.index(self.get_field_attr(x, "id")),
-                )
+        # Replace each Entry's fields with the new merged ones.
+        for entry in entries:
+            entry.fields = list(all_fields)
 
     # def move_entry_field(self, entry_index, old_index, new_index) -> None:
     # 	"""Moves a field in entry[entry_index] from position entry.fields[old_index] to entry.fields[new_index]"""
@@ -2162,22 +2327,23 @@ class Library:
 
     def get_field_attr(self, entry_field: dict, attribute: str):
         """Returns the value of a specified attribute inside an Entry field."""
-        if attribute.lower() == "id":
-            return list(entry_field.keys())[0]
-        elif attribute.lower() == "content":
-            return entry_field[self.get_field_attr(entry_field, "id")]
+        attribute = attribute.lower()
+        # Fields only have the one key, so take it without copying the keys.
+        field_id = next(iter(entry_field))
+        if attribute == "id":
+            return field_id
+        elif attribute == "content":
+            return entry_field[field_id]
         else:
-            return self.get_field_obj(self.get_field_attr(entry_field, "id"))[
-                attribute.lower()
-            ]
+            return self.get_field_obj(field_id)[attribute]
 
     def get_field_obj(self, field_id: int) -> dict:
         """
         Returns a field template object associated with a field ID.
         The objects have "id", "name", and "type" fields.
         """
-        if int(field_id) < len(self.default_fields):
-            return self.default_fields[int(field_id)]
+        if field := DEFAULT_FIELDS_BY_ID.get(int(field_id)):
+            return field
         else:
             return {"id": -1, "name": "Unknown Field", "type": "unknown"}
 
@@ -2190,8 +2356,9 @@ class Library:
         # entry: Entry = self.entries[entry_index]
         # entry = self.get_entry(entry_id)
         if entry.fields:
+            field_id = int(field_id)
             for i, field in enumerate(entry.fields):
-                if self.get_field_attr(field, "id") == int(field_id):
+                if self.get_field_attr(field, "id") == field_id:
                     matched.append(i)
 
         return matched
@@ -2204,22 +2371,23 @@ class Library:
         Uses name_and_alias_to_tag_id_map.
         """
         # tag_id: int, tag_name: str, tag_aliases: list[str] = []
-        name: str = strip_punctuation(tag.name).lower()
-        if name not in self._tag_strings_to_id_map:
-            self._tag_strings_to_id_map[name] = []
-        self._tag_strings_to_id_map[name].append(tag.id)
-
-        shorthand: str = strip_punctuation(tag.shorthand).lower()
-        if shorthand not in self._tag_strings_to_id_map:
-            self._tag_strings_to_id_map[shorthand] = []
-        self._tag_strings_to_id_map[shorthand].append(tag.id)
-
-        for alias in tag.aliases:
-            alias = strip_punctuation(alias).lower()
-            if alias not in self._tag_strings_to_id_map:
-                self._tag_strings_to_id_map[alias] = []
-            self._tag_strings_to_id_map[alias].append(tag.id)
-            # print(f'{alias.lower()} -> {tag.id}')
+        for string in (tag.name, tag.shorthand, *tag.aliases):
+            string = strip_punctuation(string).lower()
+            self._tag_strings_to_id_map.setdefault(string, []).append(tag.id)
+            # print(f'{string} -> {tag.id}')
+
+    def _unmap_tag_strings_from_tag_id(self, tag: Tag) -> None:
+        """
+        Removes a Tag's name, shorthand, and aliases mappings to its ID.
+        The inverse of '_map_tag_strings_to_tag_id()'.
+        """
+        for string in (tag.name, tag.shorthand, *tag.aliases):
+            string = strip_punctuation(string).lower()
+            ids = self._tag_strings_to_id_map[string]
+            ids.remove(tag.id)
+            # Delete the map key if it doesn't point to any other IDs.
+            if not ids:
+                del self._tag_strings_to_id_map[string]
 
     def _map_tag_id_to_cluster(self, tag: Tag, subtags: list[Tag] = None) -> None:
         """
@@ -2230,24 +2398,24 @@ class Library:
         """
         # If a list of subtags is not provided, the method will revert to a level 1-depth
         # mapping based on the given Tag's own subtags.
-        if not subtags:
-            subtags = [self.get_tag(sub_id) for sub_id in tag.subtag_ids]
-        for subtag in subtags:
-            if subtag.id not in self._tag_id_to_cluster_map.keys():
-                self._tag_id_to_cluster_map[subtag.id] = []
+        if subtags:
+            stack = [subtag.id for subtag in reversed(subtags)]
+        else:
+            stack = list(reversed(tag.subtag_ids))
+        # NOTE: Walks the whole subtag tree with an explicit stack instead of
+        # recursing once per level, in the same order as a depth-first recursion.
+        while stack:
+            sub_id = stack.pop()
+            cluster = self._tag_id_to_cluster_map.setdefault(sub_id, [])
             # Stops circular references
-            if tag.id not in self._tag_id_to_cluster_map[subtag.id]:
-                self._tag_id_to_cluster_map[subtag.id].append(tag.id)
-                # If the subtag has subtags of it own, recursively link those to the original Tag.
-                if subtag.subtag_ids:
-                    self._map_tag_id_to_cluster(
-                        tag,
-                        [
-                            self.get_tag(sub_id)
-                            for sub_id in subtag.subtag_ids
-                            if sub_id != tag.id
-                        ],
-                    )
+            if tag.id not in cluster:
+                cluster.append(tag.id)
+                # If the subtag has subtags of it own, link those to the original Tag.
+                stack.extend(
+                    id
+                    for id in reversed(self.get_tag(sub_id).subtag_ids)
+                    if id != tag.id
+                )
 
     def _map_tag_id_to_index(self, tag: Tag, index: int) -> None:
         """
@@ -2311,7 +2479,33 @@ class Library:
 
     def sort_fields(self, entry_id: int, order: list[int]) -> None:
         """Sorts an Entry's Fields given an ordered list of Field IDs."""
-        entry = self.get_entry(entry_id)
-        entry.fields = sorted(
-            entry.fields, key=lambda x: order.index(self.get_field_attr(x, "id"))
-        )
+        self.sort_fields_in_entries([entry_id], order)
+
+    def sort_fields_in_entries(self, entry_ids: list[int], order: list[int]) -> None:
+        """
+        Sorts the Fields of each of the given Entries given an ordered list of Field IDs.
+        The order is only mapped once for the whole batch.
+        """
+        key = self._field_sort_key(order)
+        for entry_id in entry_ids:
+            entry = self.get_entry(entry_id)
+            entry.fields.sort(key=key)
+
+    def _sorted_fields(self, fields: list[dict], order: list[int]) -> list[dict]:
+        """
+        Returns a list of Fields sorted by the position of their IDs in the given order.
+        Fields with IDs not present in the order are kept at the end.
+        """
+        return sorted(fields, key=self._field_sort_key(order))
+
+    def _field_sort_key(self, order: list[int]) -> Callable[[dict], int]:
+        """
+        Returns a sort key giving the position of a Field's ID in the given order.
+        Fields with IDs not present in the order are placed at the end.
+        """
+        # Map each Field ID to its position once instead of searching the order
+        # list for every comparison.
+        positions: dict[int, int] = {}
+        for i, field_id in enumerate(order):
+            positions.setdefault(field_id, i)
+        return lambda x: positions.get(next(iter(x)), len(order))
@@ -2,10 +2,15 @@
 # Licensed under the GPL-3.0 License.
 # Created for TagStudio: https://github.com/CyanVoxel/TagStudio
 
-from enum import Enum
+from typing import cast
 
 
-class ColorType(int, Enum):
+class ColorType:
+    """
+    Tag color roles. Kept as plain ints rather than an Enum since they're
+    looked up for every Tag widget that gets drawn.
+    """
+
     PRIMARY = 0
     TEXT = 1
     BORDER = 2
@@ -13,7 +18,7 @@ class ColorType(int, Enum):
     DARK_ACCENT = 4
 
 
-_TAG_COLORS = {
+_TAG_COLORS: dict[str, dict[int, str | int]] = {
     "": {
         ColorType.PRIMARY: "#1e1e1e",
         ColorType.TEXT: ColorType.LIGHT_ACCENT,
@@ -278,12 +283,31 @@ _TAG_COLORS = {
 }
 
 
+def _build_color_lut() -> dict[str, tuple[str, ...]]:
+    """
+    Flattens _TAG_COLORS into tuples indexed by ColorType, with the TEXT color
+    already resolved to the color it references.
+    """
+    lut: dict[str, tuple[str, ...]] = {}
+    for name, colors in _TAG_COLORS.items():
+        row: list[str] = []
+        for t in range(len(colors)):
+            value = colors[t]
+            # The TEXT color holds the ColorType of the color it uses.
+            if isinstance(value, int):
+                value = colors[value]
+            row.append(cast(str, value))
+        lut[name] = tuple(row)
+    return lut
+
+
+_TAG_COLOR_LUT = _build_color_lut()
+
+
 def get_tag_color(type, color):
-    color = color.lower()
     try:
-        if type == ColorType.TEXT:
-            return get_tag_color(_TAG_COLORS[color][type], color)
-        else:
-            return _TAG_COLORS[color][type]
-    except KeyError:
-        return "#FF00FF"
+        if type >= 0:
+            return _TAG_COLOR_LUT[color.lower()][type]
+    except (KeyError, IndexError):
+        pass
+    return "#FF00FF"
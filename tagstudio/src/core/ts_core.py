@@ -21,6 +21,24 @@ class TagStudioCore:
 
     def __init__(self):
         self.lib: Library = Library()
+        # The last parsed conditions file, keyed by its path and modified time.
+        self._conditions_cache: tuple | None = None
+
+    def _load_conditions(self, cond_file: Path) -> list[tuple[dict, list[str]]]:
+        """
+        Returns each condition in the conditions file paired with its resolved
+        path conditions. The file is only parsed again after it has been modified.
+        """
+        key = (cond_file, cond_file.stat().st_mtime_ns)
+        if self._conditions_cache is None or self._conditions_cache[0] != key:
+            with open(cond_file, "r", encoding="utf8") as f:
+                json_dump = json.load(f)
+            conditions = [
+                (c, [str(Path(path_c).resolve()) for path_c in c["path_conditions"]])
+                for c in json_dump["conditions"]
+            ]
+            self._conditions_cache = (key, conditions)
+        return self._conditions_cache[1]
 
     def get_gdl_sidecar(self, filepath: str | Path, source: str = "") -> dict:
         """
@@ -111,57 +129,49 @@ class TagStudioCore:
         entry: Entry = self.lib.get_entry(entry_id)
         try:
             if cond_file.is_file():
-                with open(cond_file, "r", encoding="utf8") as f:
-                    json_dump = json.load(f)
-                    for c in json_dump["conditions"]:
-                        match: bool = False
-                        for path_c in c["path_conditions"]:
-                            if str(Path(path_c).resolve()) in str(entry.path):
-                                match = True
-                                break
-                        if match:
-                            if fields := c.get("fields"):
-                                for field in fields:
-                                    field_id = self.lib.get_field_attr(field, "id")
-                                    content = field[field_id]
-
-                                    if (
-                                        self.lib.get_field_obj(int(field_id))["type"]
-                                        == "tag_box"
-                                    ):
-                                        existing_fields: list[int] = (
-                                            self.lib.get_field_index_in_entry(
-                                                entry, field_id
-                                            )
+                # The Entry's path is the same for every condition, so it's only
+                # converted to a string once.
+                entry_path = str(entry.path)
+                for c, path_conditions in self._load_conditions(cond_file):
+                    if any(path_c in entry_path for path_c in path_conditions):
+                        if fields := c.get("fields"):
+                            for field in fields:
+                                field_id = self.lib.get_field_attr(field, "id")
+                                content = field[field_id]
+
+                                if (
+                                    self.lib.get_field_obj(int(field_id))["type"]
+                                    == "tag_box"
+                                ):
+                                    existing_fields: list[int] = (
+                                        self.lib.get_field_index_in_entry(
+                                            entry, field_id
                                         )
-                                        if existing_fields:
-                                            self.lib.update_entry_field(
-                                                entry_id,
-                                                existing_fields[0],
-                                                content,
-                                                "append",
-                                            )
-                                        else:
-                                            self.lib.add_field_to_entry(
-                                                entry_id, field_id
-                                            )
-                                            self.lib.update_entry_field(
-                                                entry_id, -1, content, "append"
-                                            )
-
-                                    if (
-                                        self.lib.get_field_obj(int(field_id))["type"]
-                                        in TEXT_FIELDS
+                                    )
+                                    if existing_fields:
+                                        self.lib.update_entry_field(
+                                            entry_id,
+                                            existing_fields[0],
+                                            content,
+                                            "append",
+                                        )
+                                    else:
+                                        self.lib.add_field_to_entry(entry_id, field_id)
+                                        self.lib.update_entry_field(
+                                            entry_id, -1, content, "append"
+                                        )
+
+                                if (
+                                    self.lib.get_field_obj(int(field_id))["type"]
+                                    in TEXT_FIELDS
+                                ):
+                                    if not self.lib.does_field_content_exist(
+                                        entry_id, field_id, content
                                     ):
-                                        if not self.lib.does_field_content_exist(
-                                            entry_id, field_id, content
-                                        ):
-                                            self.lib.add_field_to_entry(
-                                                entry_id, field_id
-                                            )
-                                            self.lib.update_entry_field(
-                                                entry_id, -1, content, "replace"
-                                            )
+                                        self.lib.add_field_to_entry(entry_id, field_id)
+                                        self.lib.update_entry_field(
+                                            entry_id, -1, content, "replace"
+                                        )
         except:
             print("Error in match_conditions...")
             # input()
@@ -2,25 +2,11 @@
 # Licensed under the GPL-3.0 License.
 # Created for TagStudio: https://github.com/CyanVoxel/TagStudio
 
+# Translation table mapping each punctuation character to None, built once so
+# that stripping a string is a single pass instead of one replace per character.
+_PUNCTUATION_TABLE = str.maketrans("", "", "()[]{}'`’‘\"“”_- 　")
+
 
 def strip_punctuation(string: str) -> str:
     """Returns a given string stripped of all punctuation characters."""
-    return (
-        string.replace("(", "")
-        .replace(")", "")
-        .replace("[", "")
-        .replace("]", "")
-        .replace("{", "")
-        .replace("}", "")
-        .replace("'", "")
-        .replace("`", "")
-        .replace("’", "")
-        .replace("‘", "")
-        .replace('"', "")
-        .replace("“", "")
-        .replace("”", "")
-        .replace("_", "")
-        .replace("-", "")
-        .replace(" ", "")
-        .replace("　", "")
-    )
+    return string.translate(_PUNCTUATION_TABLE)
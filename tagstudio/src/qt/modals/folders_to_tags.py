@@ -85,13 +85,16 @@ def reverse_tag(library: Library, tag: Tag, list: list[Tag]) -> list[Tag]:
     else:
         list = [tag]
 
-    if len(tag.subtag_ids) == 0:
-        list.reverse()
-        return list
-    else:
-        for subtag_id in tag.subtag_ids:
-            subtag = library.get_tag(subtag_id)
-        return reverse_tag(library, subtag, list)
+    # NOTE: Only the last subtag of each Tag is followed, so it's the only one
+    # looked up, and the chain is walked in a loop rather than recursing per level.
+    # The visited IDs stop subtag cycles from looping forever.
+    seen: set[int] = {tag.id}
+    while tag.subtag_ids and tag.subtag_ids[-1] not in seen:
+        tag = library.get_tag(tag.subtag_ids[-1])
+        seen.add(tag.id)
+        list.append(tag)
+    list.reverse()
+    return list
 
 
 # =========== UI ===========
@@ -60,7 +60,6 @@ from src.core.library import ItemType
 from src.core.ts_core import TagStudioCore
 from src.core.constants import (
     COLLAGE_FOLDER_NAME,
-    BACKUP_FOLDER_NAME,
     TS_FOLDER_NAME,
     VERSION_BRANCH,
     VERSION,
@@ -101,12 +100,35 @@ ERROR = f"[ERROR]"
 WARNING = f"[WARNING]"
 INFO = f"[INFO]"
 
+# The order of Field IDs used by the "sort-fields" Macro.
+FIELD_SORT_ORDER: list[int] = (
+    [0]
+    + [1, 2]
+    + [9, 17, 18, 19, 20]
+    + [8, 7, 6]
+    + [4]
+    + [3, 21]
+    + [10, 14, 11, 12, 13, 22]
+    + [5]
+)
+
 logging.basicConfig(format="%(message)s", level=logging.INFO)
 
 
 class NavigationState:
     """Represents a state of the Library grid view."""
 
+    # One of these is kept per visited page, so skip the per-instance __dict__.
+    __slots__ = (
+        "contents",
+        "scrollbar_pos",
+        "page_index",
+        "page_count",
+        "search_text",
+        "thumb_size",
+        "spacing",
+    )
+
     def __init__(
         self,
         contents,
@@ -706,11 +728,33 @@ class QtDriver(QObject):
         logging.info(f"Backing Up Library...")
         self.main_window.statusbar.showMessage(f"Saving Library...")
         start_time = time.time()
-        fn = self.lib.save_library_backup_to_disk()
-        end_time = time.time()
-        self.main_window.statusbar.showMessage(
-            f'Library Backup Saved at: "{ self.lib.library_dir / TS_FOLDER_NAME / BACKUP_FOLDER_NAME / fn}" ({format_timespan(end_time - start_time)})'
-        )
+        # NOTE: The Library is serialized here on the main thread, since the UI can
+        # edit it at any time. Only writing out the finished text is handed off.
+        filepath, text = self.lib.serialize_library_backup()
+        errors: list[Exception] = []
+
+        def write_backup():
+            try:
+                filepath.write_text(text, encoding="utf-8")
+            except Exception as e:
+                errors.append(e)
+
+        def backup_written():
+            if errors:
+                logging.error(
+                    f'[QT DRIVER] Library Backup could not be saved at "{filepath}": {errors[0]}'
+                )
+                self.main_window.statusbar.showMessage(
+                    f"Library Backup Failed: {errors[0]}"
+                )
+            else:
+                self.main_window.statusbar.showMessage(
+                    f'Library Backup Saved at: "{filepath}" ({format_timespan(time.time() - start_time)})'
+                )
+
+        r = CustomRunnable(write_backup)
+        r.done.connect(backup_written)
+        QThreadPool.globalInstance().start(r)
 
     def add_tag_action_callback(self):
         self.modal = PanelModal(
@@ -725,8 +769,11 @@ class QtDriver(QObject):
         self.modal.show()
 
     def select_all_action_callback(self):
+        # Check membership against a set rather than rescanning the selection.
+        selected = set(self.selected)
         for item in self.item_thumbs:
-            if item.mode and (item.mode, item.item_id) not in self.selected:
+            if item.mode and (item.mode, item.item_id) not in selected:
+                selected.add((item.mode, item.item_id))
                 self.selected.append((item.mode, item.item_id))
                 item.thumb_button.set_selected(True)
 
@@ -892,6 +939,10 @@ class QtDriver(QObject):
 
     def run_macros(self, name: str, entry_ids: list[int]):
         """Runs a specific Macro on a group of given entry_ids."""
+        if name == "sort-fields":
+            # Sorting needs nothing from each Entry's file, so do it in one batch.
+            self.lib.sort_fields_in_entries(entry_ids, FIELD_SORT_ORDER)
+            return
         for id in entry_ids:
             self.run_macro(name, id)
 
@@ -914,17 +965,7 @@ class QtDriver(QObject):
             data = {"source": self.core.build_url(entry_id, source)}
             self.lib.add_generic_data_to_entry(data, entry_id)
         elif name == "sort-fields":
-            order: list[int] = (
-                [0]
-                + [1, 2]
-                + [9, 17, 18, 19, 20]
-                + [8, 7, 6]
-                + [4]
-                + [3, 21]
-                + [10, 14, 11, 12, 13, 22]
-                + [5]
-            )
-            self.lib.sort_fields(entry_id, order)
+            self.lib.sort_fields(entry_id, FIELD_SORT_ORDER)
         elif name == "match":
             self.core.match_conditions(entry_id)
         # elif name == 'scrape':
@@ -1159,12 +1200,18 @@ class QtDriver(QObject):
             # logging.info(f'Current Selected Index: {current_index}')
             # logging.info(f'Index Range: {index_range}')
 
-            for c_type, c_id in index_range:
-                for it in self.item_thumbs:
-                    if it.mode == c_type and it.item_id == c_id:
-                        it.thumb_button.set_selected(True)
-                        if ((c_type, c_id)) not in self.selected:
-                            self.selected.append((c_type, c_id))
+            # Look up the thumbs and existing selection by item once, instead of
+            # rescanning both for every item in the range.
+            thumbs: dict[tuple[ItemType, int], list[ItemThumb]] = {}
+            for it in self.item_thumbs:
+                thumbs.setdefault((it.mode, it.item_id), []).append(it)
+            selected = set(self.selected)
+            for item in index_range:
+                for it in thumbs.get(item, []):
+                    it.thumb_button.set_selected(True)
+                    if item not in selected:
+                        selected.add(item)
+                        self.selected.append(item)
         else:
             # for i in self.selected:
             # 	if i[1] == self.cur_frame_idx:
@@ -1254,8 +1301,9 @@ class QtDriver(QObject):
                     filepath = self.lib.library_dir / entry.path / entry.filename
 
                     item_thumb.set_item_id(entry.id)
-                    item_thumb.assign_archived(entry.has_tag(self.lib, TAG_ARCHIVED))
-                    item_thumb.assign_favorite(entry.has_tag(self.lib, TAG_FAVORITE))
+                    tag_ids = entry.tag_ids(self.lib)
+                    item_thumb.assign_archived(TAG_ARCHIVED in tag_ids)
+                    item_thumb.assign_favorite(TAG_FAVORITE in tag_ids)
                     # ctrl_down = True if QGuiApplication.keyboardModifiers() else False
                     # TODO: Change how this works. The click function
                     # for collations a few lines down should NOT be allowed during modifier keys.
@@ -1360,18 +1408,15 @@ class QtDriver(QObject):
             # self.filtered_items = self.lib.search_library(query)
             # 73601 Entries at 500 size should be 246
             all_items = self.lib.search_library(query, search_mode=self.search_mode)
-            frames: list[list[tuple[ItemType, int]]] = []
-            frame_count = math.ceil(len(all_items) / self.max_results)
-            for i in range(0, frame_count):
-                frames.append(
-                    all_items[
-                        min(len(all_items) - 1, (i) * self.max_results) : min(
-                            len(all_items), (i + 1) * self.max_results
-                        )
-                    ]
-                )
-            for i, f in enumerate(frames):
-                logging.info(f"Query:{query}, Frame: {i},  Length: {len(f)}")
+            frames: list[list[tuple[ItemType, int]]] = [
+                all_items[i : i + self.max_results]
+                for i in range(0, len(all_items), self.max_results)
+            ]
+            # NOTE: Logged once per search rather than once per frame, since large
+            # Libraries can have hundreds of frames for a single query.
+            logging.info(
+                f"Query:{query}, Frames: {len(frames)}, Results: {len(all_items)}"
+            )
             self.frame_dict[query] = frames
             # self.frame_dict[query] = [all_items]
 
@@ -1419,20 +1464,24 @@ class QtDriver(QObject):
         self.settings.beginGroup(SettingItems.LIBS_LIST)
 
         all_libs = {str(time.time()): str(path)}
+        saved_keys: set[str] = set(self.settings.allKeys())
 
-        for item_key in self.settings.allKeys():
+        for item_key in saved_keys:
             item_path = self.settings.value(item_key)
             if Path(item_path) != path:
                 all_libs[item_key] = item_path
 
         # sort items, most recent first
-        all_libs = sorted(all_libs.items(), key=lambda item: item[0], reverse=True)
+        sorted_libs = sorted(all_libs.items(), key=lambda item: item[0], reverse=True)
+        all_libs = dict(sorted_libs[:ITEMS_LIMIT])
 
-        # remove previously saved items
-        self.settings.clear()
-
-        for item_key, item_value in all_libs[:ITEMS_LIMIT]:
-            self.settings.setValue(item_key, item_value)
+        # NOTE: Only the items that changed are written, instead of clearing and
+        # rewriting the whole list. QSettings.clear() also ignores the current
+        # group, so it was wiping every other setting along with the list.
+        for item_key in saved_keys - all_libs.keys():
+            self.settings.remove(item_key)
+        for item_key in all_libs.keys() - saved_keys:
+            self.settings.setValue(item_key, all_libs[item_key])
 
         self.settings.endGroup()
         self.settings.sync()
@@ -1601,13 +1650,19 @@ class QtDriver(QObject):
                 / COLLAGE_FOLDER_NAME
                 / f'collage_{dt.utcnow().strftime("%F_%T").replace(":", "")}.png'
             )
-            self.collage.save(filename)
+            collage = self.collage
             self.collage = None
 
-            end_time = time.time()
-            self.main_window.statusbar.showMessage(
-                f'Collage Saved at "{filename}" ({format_timespan(end_time - self.collage_start_time)})'
-            )
-            logging.info(
-                f'Collage Saved at "{filename}" ({format_timespan(end_time - self.collage_start_time)})'
-            )
+            def collage_saved():
+                end_time = time.time()
+                self.main_window.statusbar.showMessage(
+                    f'Collage Saved at "{filename}" ({format_timespan(end_time - self.collage_start_time)})'
+                )
+                logging.info(
+                    f'Collage Saved at "{filename}" ({format_timespan(end_time - self.collage_start_time)})'
+                )
+
+            # Encoding a large collage can take a while, so keep it off the main thread.
+            r = CustomRunnable(lambda: collage.save(filename))
+            r.done.connect(collage_saved)
+            QThreadPool.globalInstance().start(r)
@@ -361,7 +361,7 @@ class ItemThumb(FlowWidget):
         if ext and ext not in IMAGE_TYPES or ext in [".gif", ".apng"]:
             self.ext_badge.setHidden(False)
             self.ext_badge.setText(ext.upper()[1:])
-            if ext in VIDEO_TYPES + AUDIO_TYPES:
+            if ext in VIDEO_TYPES or ext in AUDIO_TYPES:
                 self.count_badge.setHidden(False)
         else:
             if self.mode == ItemType.ENTRY:
@@ -407,12 +407,10 @@ class ItemThumb(FlowWidget):
         if self.mode == ItemType.ENTRY:
             # logging.info(f'[UPDATE BADGES] ENTRY: {self.lib.get_entry(self.item_id)}')
             # logging.info(f'[UPDATE BADGES] ARCH: {self.lib.get_entry(self.item_id).has_tag(self.lib, 0)}, FAV: {self.lib.get_entry(self.item_id).has_tag(self.lib, 1)}')
-            self.assign_archived(
-                self.lib.get_entry(self.item_id).has_tag(self.lib, TAG_ARCHIVED)
-            )
-            self.assign_favorite(
-                self.lib.get_entry(self.item_id).has_tag(self.lib, TAG_FAVORITE)
-            )
+            entry = self.lib.get_entry(self.item_id)
+            tag_ids = entry.tag_ids(self.lib)
+            self.assign_archived(TAG_ARCHIVED in tag_ids)
+            self.assign_favorite(TAG_FAVORITE in tag_ids)
 
     def set_item_id(self, id: int):
         """
@@ -237,8 +237,15 @@ class PreviewPanel(QWidget):
     def fill_libs_widget(self, layout: QVBoxLayout):
         settings = self.driver.settings
         settings.beginGroup(SettingItems.LIBS_LIST)
+        item_tstamps = settings.allKeys()
+        new_keys = set(item_tstamps)
+        if new_keys == self.render_libs:
+            # no need to re-render, or to read the paths back out of the settings
+            settings.endGroup()
+            return
+
         lib_items: dict[str, tuple[str, str]] = {}
-        for item_tstamp in settings.allKeys():
+        for item_tstamp in item_tstamps:
             val: str = settings.value(item_tstamp)  # type: ignore
             cut_val = val
             if len(val) > 45:
@@ -247,11 +254,6 @@ class PreviewPanel(QWidget):
 
         settings.endGroup()
 
-        new_keys = set(lib_items.keys())
-        if new_keys == self.render_libs:
-            # no need to re-render
-            return
-
         # sort lib_items by the key
         libs_sorted = sorted(lib_items.items(), key=lambda item: item[0], reverse=True)
 
@@ -425,11 +427,13 @@ class PreviewPanel(QWidget):
 
     def add_field_to_selected(self, field_id: int):
         """Adds an entry field to one or more selected items."""
-        added = set()
-        for item_pair in self.selected:
-            if item_pair[0] == ItemType.ENTRY and item_pair[1] not in added:
-                self.lib.add_field_to_entry(item_pair[1], field_id)
-                added.add(item_pair[1])
+        # dict.fromkeys() drops duplicate IDs while keeping selection order.
+        entry_ids = dict.fromkeys(
+            item_pair[1]
+            for item_pair in self.selected
+            if item_pair[0] == ItemType.ENTRY
+        )
+        self.lib.add_field_to_entries(list(entry_ids), field_id)
 
     # def update_widgets(self, item: Union[Entry, Collation, Tag]):
     def update_widgets(self):
@@ -516,9 +520,10 @@ class PreviewPanel(QWidget):
                     # TODO: Do this somewhere else, this is just here temporarily.
                     try:
                         image = None
-                        if filepath.suffix.lower() in IMAGE_TYPES:
+                        ext: str = filepath.suffix.lower()
+                        if ext in IMAGE_TYPES:
                             image = Image.open(str(filepath))
-                        elif filepath.suffix.lower() in RAW_IMAGE_TYPES:
+                        elif ext in RAW_IMAGE_TYPES:
                             try:
                                 with rawpy.imread(str(filepath)) as raw:
                                     rgb = raw.postprocess()
@@ -530,7 +535,7 @@ class PreviewPanel(QWidget):
                                 rawpy._rawpy.LibRawFileUnsupportedError,
                             ):
                                 pass
-                        elif filepath.suffix.lower() in VIDEO_TYPES:
+                        elif ext in VIDEO_TYPES:
                             video = cv2.VideoCapture(str(filepath))
                             if video.get(cv2.CAP_PROP_FRAME_COUNT) <= 0:
                                 raise cv2.error("File is invalid or has 0 frames")
@@ -552,8 +557,10 @@ class PreviewPanel(QWidget):
                                 self.preview_vid.show()
 
                         # Stats for specific file types are displayed here.
-                        if image and filepath.suffix.lower() in (
-                            IMAGE_TYPES + VIDEO_TYPES + RAW_IMAGE_TYPES
+                        if image and (
+                            ext in IMAGE_TYPES
+                            or ext in VIDEO_TYPES
+                            or ext in RAW_IMAGE_TYPES
                         ):
                             self.dimensions_label.setText(
                                 f"{filepath.suffix.upper()[1:]}  •  {format_size(filepath.stat().st_size)}\n{image.width} x {image.height} px"
@@ -795,12 +802,16 @@ class PreviewPanel(QWidget):
             container = self.containers[index]
             # container.inner_layout.removeItem(container.inner_layout.itemAt(1))
             # container.setHidden(False)
-        if self.lib.get_field_attr(field, "type") == "tag_box":
+        # NOTE: Reads the field and its template once, rather than on every use.
+        field_type = self.lib.get_field_attr(field, "type")
+        field_name = self.lib.get_field_attr(field, "name")
+        field_content = self.lib.get_field_attr(field, "content")
+        if field_type == "tag_box":
             # logging.info(f'WRITING TAGBOX FOR ITEM {item.id}')
-            container.set_title(self.lib.get_field_attr(field, "name"))
+            container.set_title(field_name)
             # container.set_editable(False)
             container.set_inline(False)
-            title = f"{self.lib.get_field_attr(field, 'name')} (Tag Box)"
+            title = f"{field_name} (Tag Box)"
             if not mixed:
                 item = self.lib.get_entry(
                     self.selected[0][1]
@@ -808,7 +819,7 @@ class PreviewPanel(QWidget):
                 if type(container.get_inner_widget()) == TagBoxWidget:
                     inner_container: TagBoxWidget = container.get_inner_widget()
                     inner_container.set_item(item)
-                    inner_container.set_tags(self.lib.get_field_attr(field, "content"))
+                    inner_container.set_tags(field_content)
                     try:
                         inner_container.updated.disconnect()
                     except RuntimeError:
@@ -820,7 +831,7 @@ class PreviewPanel(QWidget):
                         title,
                         index,
                         self.lib,
-                        self.lib.get_field_attr(field, "content"),
+                        field_content,
                         self.driver,
                     )
 
@@ -836,7 +847,7 @@ class PreviewPanel(QWidget):
                 # NOTE: Tag Boxes have no Edit Button (But will when you can convert field types)
                 # f'Are you sure you want to remove this \"{self.lib.get_field_attr(field, "name")}\" field?'
                 # container.set_remove_callback(lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets(item)))
-                prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+                prompt = f'Are you sure you want to remove this "{field_name}" field?'
                 callback = lambda: (self.remove_field(field), self.update_widgets())
                 container.set_remove_callback(
                     lambda: self.remove_message_box(prompt=prompt, callback=callback)
@@ -845,7 +856,7 @@ class PreviewPanel(QWidget):
                 container.set_edit_callback(None)
             else:
                 text = "<i>Mixed Data</i>"
-                title = f"{self.lib.get_field_attr(field, 'name')} (Wacky Tag Box)"
+                title = f"{field_name} (Wacky Tag Box)"
                 inner_container = TextWidget(title, text)
                 container.set_inner_widget(inner_container)
                 container.set_copy_callback(None)
@@ -854,25 +865,25 @@ class PreviewPanel(QWidget):
 
             self.tags_updated.emit()
             # self.dynamic_widgets.append(inner_container)
-        elif self.lib.get_field_attr(field, "type") in "text_line":
+        elif field_type in "text_line":
             # logging.info(f'WRITING TEXTLINE FOR ITEM {item.id}')
-            container.set_title(self.lib.get_field_attr(field, "name"))
+            container.set_title(field_name)
             # container.set_editable(True)
             container.set_inline(False)
             # Normalize line endings in any text content.
             if not mixed:
-                text = self.lib.get_field_attr(field, "content").replace("\r", "\n")
+                text = field_content.replace("\r", "\n")
             else:
                 text = "<i>Mixed Data</i>"
-            title = f"{self.lib.get_field_attr(field, 'name')} (Text Line)"
+            title = f"{field_name} (Text Line)"
             inner_container = TextWidget(title, text)
             container.set_inner_widget(inner_container)
             # if type(item) == Entry:
             if not mixed:
                 modal = PanelModal(
-                    EditTextLine(self.lib.get_field_attr(field, "content")),
+                    EditTextLine(field_content),
                     title=title,
-                    window_title=f'Edit {self.lib.get_field_attr(field, "name")}',
+                    window_title=f"Edit {field_name}",
                     save_callback=(
                         lambda content: (
                             self.update_field(field, content),
@@ -881,7 +892,7 @@ class PreviewPanel(QWidget):
                     ),
                 )
                 container.set_edit_callback(modal.show)
-                prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+                prompt = f'Are you sure you want to remove this "{field_name}" field?'
                 callback = lambda: (self.remove_field(field), self.update_widgets())
                 container.set_remove_callback(
                     lambda: self.remove_message_box(prompt=prompt, callback=callback)
@@ -893,26 +904,26 @@ class PreviewPanel(QWidget):
                 container.set_remove_callback(None)
             # container.set_remove_callback(lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets(item)))
 
-        elif self.lib.get_field_attr(field, "type") in "text_box":
+        elif field_type in "text_box":
             # logging.info(f'WRITING TEXTBOX FOR ITEM {item.id}')
-            container.set_title(self.lib.get_field_attr(field, "name"))
+            container.set_title(field_name)
             # container.set_editable(True)
             container.set_inline(False)
             # Normalize line endings in any text content.
             if not mixed:
-                text = self.lib.get_field_attr(field, "content").replace("\r", "\n")
+                text = field_content.replace("\r", "\n")
             else:
                 text = "<i>Mixed Data</i>"
-            title = f"{self.lib.get_field_attr(field, 'name')} (Text Box)"
+            title = f"{field_name} (Text Box)"
             inner_container = TextWidget(title, text)
             container.set_inner_widget(inner_container)
             # if type(item) == Entry:
             if not mixed:
                 container.set_copy_callback(None)
                 modal = PanelModal(
-                    EditTextBox(self.lib.get_field_attr(field, "content")),
+                    EditTextBox(field_content),
                     title=title,
-                    window_title=f'Edit {self.lib.get_field_attr(field, "name")}',
+                    window_title=f"Edit {field_name}",
                     save_callback=(
                         lambda content: (
                             self.update_field(field, content),
@@ -921,7 +932,7 @@ class PreviewPanel(QWidget):
                     ),
                 )
                 container.set_edit_callback(modal.show)
-                prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+                prompt = f'Are you sure you want to remove this "{field_name}" field?'
                 callback = lambda: (self.remove_field(field), self.update_widgets())
                 container.set_remove_callback(
                     lambda: self.remove_message_box(prompt=prompt, callback=callback)
@@ -930,63 +941,63 @@ class PreviewPanel(QWidget):
                 container.set_edit_callback(None)
                 container.set_copy_callback(None)
                 container.set_remove_callback(None)
-        elif self.lib.get_field_attr(field, "type") == "collation":
+        elif field_type == "collation":
             # logging.info(f'WRITING COLLATION FOR ITEM {item.id}')
-            container.set_title(self.lib.get_field_attr(field, "name"))
+            container.set_title(field_name)
             # container.set_editable(True)
             container.set_inline(False)
-            collation = self.lib.get_collation(
-                self.lib.get_field_attr(field, "content")
-            )
-            title = f"{self.lib.get_field_attr(field, 'name')} (Collation)"
+            collation = self.lib.get_collation(field_content)
+            title = f"{field_name} (Collation)"
             text = f"{collation.title} ({len(collation.e_ids_and_pages)} Items)"
             if len(self.selected) == 1:
-                text += f" - Page {collation.e_ids_and_pages[[x[0] for x in collation.e_ids_and_pages].index(self.selected[0][1])][1]}"
+                # Stop at the selected Entry instead of copying out every Entry ID.
+                page = next(
+                    page
+                    for e_id, page in collation.e_ids_and_pages
+                    if e_id == self.selected[0][1]
+                )
+                text += f" - Page {page}"
             inner_container = TextWidget(title, text)
             container.set_inner_widget(inner_container)
             # if type(item) == Entry:
             container.set_copy_callback(None)
             # container.set_edit_callback(None)
             # container.set_remove_callback(lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets(item)))
-            prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+            prompt = f'Are you sure you want to remove this "{field_name}" field?'
             callback = lambda: (self.remove_field(field), self.update_widgets())
             container.set_remove_callback(
                 lambda: self.remove_message_box(prompt=prompt, callback=callback)
             )
-        elif self.lib.get_field_attr(field, "type") == "datetime":
+        elif field_type == "datetime":
             # logging.info(f'WRITING DATETIME FOR ITEM {item.id}')
             if not mixed:
                 try:
-                    container.set_title(self.lib.get_field_attr(field, "name"))
+                    container.set_title(field_name)
                     # container.set_editable(False)
                     container.set_inline(False)
                     # TODO: Localize this and/or add preferences.
-                    date = dt.strptime(
-                        self.lib.get_field_attr(field, "content"), "%Y-%m-%d %H:%M:%S"
-                    )
-                    title = f"{self.lib.get_field_attr(field, 'name')} (Date)"
+                    date = dt.strptime(field_content, "%Y-%m-%d %H:%M:%S")
+                    title = f"{field_name} (Date)"
                     inner_container = TextWidget(title, date.strftime("%D - %r"))
                     container.set_inner_widget(inner_container)
                 except:
-                    container.set_title(self.lib.get_field_attr(field, "name"))
+                    container.set_title(field_name)
                     # container.set_editable(False)
                     container.set_inline(False)
-                    title = f"{self.lib.get_field_attr(field, 'name')} (Date) (Unknown Format)"
-                    inner_container = TextWidget(
-                        title, str(self.lib.get_field_attr(field, "content"))
-                    )
+                    title = f"{field_name} (Date) (Unknown Format)"
+                    inner_container = TextWidget(title, str(field_content))
                 # if type(item) == Entry:
                 container.set_copy_callback(None)
                 container.set_edit_callback(None)
                 # container.set_remove_callback(lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets(item)))
-                prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+                prompt = f'Are you sure you want to remove this "{field_name}" field?'
                 callback = lambda: (self.remove_field(field), self.update_widgets())
                 container.set_remove_callback(
                     lambda: self.remove_message_box(prompt=prompt, callback=callback)
                 )
             else:
                 text = "<i>Mixed Data</i>"
-                title = f"{self.lib.get_field_attr(field, 'name')} (Wacky Date)"
+                title = f"{field_name} (Wacky Date)"
                 inner_container = TextWidget(title, text)
                 container.set_inner_widget(inner_container)
                 container.set_copy_callback(None)
@@ -994,19 +1005,17 @@ class PreviewPanel(QWidget):
                 container.set_remove_callback(None)
         else:
             # logging.info(f'[ENTRY PANEL] Unknown Type: {self.lib.get_field_attr(field, "type")}')
-            container.set_title(self.lib.get_field_attr(field, "name"))
+            container.set_title(field_name)
             # container.set_editable(False)
             container.set_inline(False)
-            title = f"{self.lib.get_field_attr(field, 'name')} (Unknown Field Type)"
-            inner_container = TextWidget(
-                title, str(self.lib.get_field_attr(field, "content"))
-            )
+            title = f"{field_name} (Unknown Field Type)"
+            inner_container = TextWidget(title, str(field_content))
             container.set_inner_widget(inner_container)
             # if type(item) == Entry:
             container.set_copy_callback(None)
             container.set_edit_callback(None)
             # container.set_remove_callback(lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets(item)))
-            prompt = f'Are you sure you want to remove this "{self.lib.get_field_attr(field, "name")}" field?'
+            prompt = f'Are you sure you want to remove this "{field_name}" field?'
             callback = lambda: (self.remove_field(field), self.update_widgets())
             # callback = lambda: (self.lib.get_entry(item.id).fields.pop(index), self.update_widgets())
             container.set_remove_callback(
@@ -154,6 +154,9 @@ class TagBoxWidget(FieldWidget):
             self.driver.lib.get_entry(x[1]).add_tag(
                 self.driver.lib, tag_id, field_id=id, field_index=-1
             )
+        # NOTE: Emitted once for the whole selection, since each emit rebuilds
+        # this Tag Box and refreshes the tagged items.
+        if self.driver.selected:
             self.updated.emit()
         if tag_id in (TAG_FAVORITE, TAG_ARCHIVED):
             self.driver.update_badges()
@@ -174,12 +177,10 @@ class TagBoxWidget(FieldWidget):
         logging.info(f"[TAG BOX WIDGET] SELECTED T:{self.driver.selected}")
         id: int = list(self.field.keys())[0]  # type: ignore
         for x in self.driver.selected:
-            index = self.driver.lib.get_field_index_in_entry(
-                self.driver.lib.get_entry(x[1]), id
-            )
-            self.driver.lib.get_entry(x[1]).remove_tag(
-                self.driver.lib, tag_id, field_index=index[0]
-            )
+            entry = self.driver.lib.get_entry(x[1])
+            index = self.driver.lib.get_field_index_in_entry(entry, id)
+            entry.remove_tag(self.driver.lib, tag_id, field_index=index[0])
+        if self.driver.selected:
             self.updated.emit()
         if tag_id in (TAG_FAVORITE, TAG_ARCHIVED):
             self.driver.update_badges()
@@ -100,6 +100,7 @@ class ThumbRenderer(QObject):
         pixmap: QPixmap = None
         final: Image.Image = None
         _filepath: Path = Path(filepath)
+        ext: str = _filepath.suffix.lower()
         resampling_method = Image.Resampling.BILINEAR
         if ThumbRenderer.font_pixel_ratio != pixel_ratio:
             ThumbRenderer.font_pixel_ratio = pixel_ratio
@@ -121,7 +122,7 @@ class ThumbRenderer(QObject):
         elif _filepath:
             try:
                 # Images =======================================================
-                if _filepath.suffix.lower() in IMAGE_TYPES:
+                if ext in IMAGE_TYPES:
                     try:
                         image = Image.open(_filepath)
                         if image.mode != "RGB" and image.mode != "RGBA":
@@ -137,7 +138,7 @@ class ThumbRenderer(QObject):
                             f"[ThumbRenderer]{WARNING} Couldn't Render thumbnail for {_filepath.name} ({type(e).__name__})"
                         )
 
-                elif _filepath.suffix.lower() in RAW_IMAGE_TYPES:
+                elif ext in RAW_IMAGE_TYPES:
                     try:
                         with rawpy.imread(str(_filepath)) as raw:
                             rgb = raw.postprocess()
@@ -160,7 +161,7 @@ class ThumbRenderer(QObject):
                         )
 
                 # Videos =======================================================
-                elif _filepath.suffix.lower() in VIDEO_TYPES:
+                elif ext in VIDEO_TYPES:
                     video = cv2.VideoCapture(str(_filepath))
                     frame_count = video.get(cv2.CAP_PROP_FRAME_COUNT)
                     if frame_count <= 0:
@@ -177,7 +178,7 @@ class ThumbRenderer(QObject):
                     image = Image.fromarray(frame)
 
                 # Plain Text ===================================================
-                elif _filepath.suffix.lower() in PLAINTEXT_TYPES:
+                elif ext in PLAINTEXT_TYPES:
                     encoding = detect_char_encoding(_filepath)
                     with open(_filepath, "r", encoding=encoding) as text_file:
                         text = text_file.read(256)
@@ -290,10 +291,8 @@ class ThumbRenderer(QObject):
                     math.ceil(adj_size / pixel_ratio),
                     math.ceil(final.size[1] / pixel_ratio),
                 ),
-                _filepath.suffix.lower(),
+                ext,
             )
 
         else:
-            self.updated.emit(
-                timestamp, QPixmap(), QSize(*base_size), _filepath.suffix.lower()
-            )
+            self.updated.emit(timestamp, QPixmap(), QSize(*base_size), ext)
@@ -1,5 +1,11 @@
+from pathlib import Path
+
 import pytest
 
+from src.core.constants import BACKUP_FOLDER_NAME, TS_FOLDER_NAME
+from src.core.enums import ItemType, SearchMode
+from src.core.library import Entry, Library, Tag
+
 
 def test_open_library(test_library, snapshot_json):
     assert test_library.entries == snapshot_json
@@ -16,3 +22,148 @@ def test_open_library(test_library, snapshot_json):
 def test_library_search(test_library, query, snapshot_json):
     res = test_library.search_library(query)
     assert res == snapshot_json
+
+
+def test_entry_eq_other_type(test_library):
+    entry = test_library.entries[0]
+    assert entry != None  # noqa: E711
+    assert entry != entry.id
+    assert entry in test_library.entries
+
+
+def test_update_entry_path_remaps_filepath(test_library):
+    entry = test_library.entries[0]
+    old_filepath = entry.path / entry.filename
+    test_library.update_entry_path(entry.id, "moved")
+    assert old_filepath not in test_library.filename_to_entry_id_map
+    new_filepath = entry.path / entry.filename
+    assert test_library.filename_to_entry_id_map[new_filepath] == entry.id
+
+
+def test_library_search_expands_clusters_once(test_library, monkeypatch):
+    calls: list[int] = []
+    get_tag_cluster = test_library.get_tag_cluster
+
+    def counting_get_tag_cluster(tag_id):
+        calls.append(tag_id)
+        return get_tag_cluster(tag_id)
+
+    monkeypatch.setattr(test_library, "get_tag_cluster", counting_get_tag_cluster)
+    test_library.search_library("First")
+    # Once per Tag ID the term maps to, regardless of how many Entries there are.
+    assert len(calls) == len(test_library._tag_strings_to_id_map["first"])
+
+
+@pytest.mark.parametrize("query", [None, "First", "tag_id: 1000", "untagged"])
+def test_library_search_skips_id_lookups(test_library, monkeypatch, query):
+    # Searching walks the Entries directly, so any per-ID lookup is a regression.
+    def fail(*args, **kwargs):
+        raise AssertionError("search_library looked up an item by ID")
+
+    monkeypatch.setattr(test_library, "get_entry", fail)
+    monkeypatch.setattr(test_library, "get_tag", fail)
+    test_library.search_library(query)
+
+
+def test_library_search_ext_list_ignores_case(test_library):
+    entry = Entry(id=100, filename="baz.JSON", path=".", fields=[])
+    test_library.add_entry_to_library(entry)
+    assert (ItemType.ENTRY, entry.id) not in test_library.search_library(None)
+
+
+def test_library_search_sees_ext_list_edits(test_library):
+    entry = Entry(id=100, filename="baz.txt", path=".", fields=[])
+    test_library.add_entry_to_library(entry)
+    assert (ItemType.ENTRY, entry.id) in test_library.search_library(None)
+    # The extension list is edited in place by the File Extensions modal.
+    test_library.ext_list.append(".TXT")
+    assert (ItemType.ENTRY, entry.id) not in test_library.search_library(None)
+
+
+def test_library_remove_entries_remaps_indices(test_library):
+    removed = [e.id for e in test_library.entries[:1]]
+    kept = [e.id for e in test_library.entries[1:]]
+    test_library.remove_entries(removed)
+    assert [e.id for e in test_library.entries] == kept
+    for entry_id in kept:
+        assert test_library.get_entry(entry_id).id == entry_id
+    assert set(test_library.filename_to_entry_id_map.values()) == set(kept)
+
+
+def test_library_update_tag_unmaps_old_strings(test_library):
+    tag_id = test_library.add_tag_to_library(Tag(-1, "Old Name", "", [], [], ""))
+    # Editing twice also checks that the empty shorthand isn't mapped again.
+    for _ in range(2):
+        test_library.update_tag(Tag(tag_id, "New Name", "", [], [], ""))
+    assert "oldname" not in test_library._tag_strings_to_id_map
+    assert test_library._tag_strings_to_id_map["newname"] == [tag_id]
+    assert test_library._tag_strings_to_id_map[""].count(tag_id) == 1
+
+
+def test_entry_tag_ids_matches_has_tag(test_library):
+    for entry in test_library.entries:
+        tag_ids = entry.tag_ids(test_library)
+        for tag in test_library.tags:
+            assert (tag.id in tag_ids) == entry.has_tag(test_library, tag.id)
+
+
+def test_library_refresh_dir_skips_symlinked_folders(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x.png").touch()
+    # A link back up the tree would make the scan loop if it were followed.
+    (tmp_path / "a" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    lib = Library()
+    lib.create_library(tmp_path)
+    list(lib.refresh_dir())
+    assert lib.files_not_in_library == [Path("a") / "x.png"]
+
+
+def test_library_mirror_entry_fields_unhashable_content(test_library):
+    # Unknown field types can hold any JSON content, including lists.
+    entry_ids = [e.id for e in test_library.entries]
+    for entry in test_library.entries:
+        entry.fields.append({999: ["a", "b"]})
+    test_library.mirror_entry_fields(entry_ids)
+    for entry in test_library.entries:
+        assert entry.fields.count({999: ["a", "b"]}) == 1
+
+
+def test_library_search_or_with_special_flag_has_no_duplicates(test_library):
+    # An Entry matching both the special flag and a tag term is only listed once.
+    results = test_library.search_library("no author first", search_mode=SearchMode.OR)
+    assert len(results) == len(set(results))
+    assert (ItemType.ENTRY, 2) in results
+
+
+def test_library_backup_round_trip(tmp_path):
+    lib = Library()
+    lib.create_library(tmp_path)
+    tag_id = lib.add_tag_to_library(Tag(-1, "Backed Up", "BU", ["Alias"], [], "red"))
+    lib.add_entry_to_library(
+        Entry(id=100, filename="foo.txt", path=".", fields=[{6: [tag_id]}])
+    )
+
+    filename = lib.save_library_backup_to_disk()
+    backup = tmp_path / TS_FOLDER_NAME / BACKUP_FOLDER_NAME / filename
+    assert backup.is_file()
+
+    # A backup is a regular library save file, so it can be opened as one.
+    library_dir = tmp_path / "restored"
+    (library_dir / TS_FOLDER_NAME).mkdir(parents=True)
+    (library_dir / TS_FOLDER_NAME / "ts_library.json").write_text(
+        backup.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    restored = Library()
+    assert restored.open_library(library_dir) == 1
+    assert restored.entries == lib.entries
+    assert restored.get_tag(tag_id).compressed_dict() == (
+        lib.get_tag(tag_id).compressed_dict()
+    )
+
+
+def test_library_update_entry_field_appends_unhashable_items(test_library):
+    entry = test_library.entries[0]
+    # Unknown field types can hold any JSON content, including nested lists.
+    entry.fields.append({999: [["a"]]})
+    test_library.update_entry_field(entry.id, -1, [["a"], ["b"]], "append")
+    assert entry.fields[-1] == {999: [["a"], ["b"]]}
@@ -1,3 +1,6 @@
+from src.core.library import Tag
+
+
 def test_subtag(test_tag):
     test_tag.remove_subtag(2)
     test_tag.remove_subtag(2)
@@ -6,3 +9,16 @@ def test_subtag(test_tag):
     # repeated add should not add the subtag
     test_tag.add_subtag(5)
     assert test_tag.subtag_ids == [3, 4, 5]
+
+
+def test_child_tag_ids_subtag_cycle(test_library):
+    parent_id, child_id = (
+        test_library.add_tag_to_library(
+            Tag(id=-1, name=name, shorthand="", aliases=[], subtags_ids=[], color="")
+        )
+        for name in ("Parent", "Child")
+    )
+    test_library.get_tag(parent_id).subtag_ids = [child_id]
+    test_library.get_tag(child_id).subtag_ids = [parent_id]
+
+    assert test_library.get_all_child_tag_ids(parent_id) == [child_id, parent_id]
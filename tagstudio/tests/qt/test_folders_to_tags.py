@@ -0,0 +1,13 @@
+from src.core.library import Tag
+from src.qt.modals.folders_to_tags import reverse_tag
+
+
+def test_reverse_tag_stops_at_subtag_cycle(test_library):
+    parent = Tag(-1, "Parent", "", [], [], "")
+    child = Tag(-1, "Child", "", [], [], "")
+    parent_id = test_library.add_tag_to_library(parent)
+    child_id = test_library.add_tag_to_library(child)
+    parent.subtag_ids = [child_id]
+    child.subtag_ids = [parent_id]
+
+    assert reverse_tag(test_library, child, None) == [parent, child]